@@ -4,16 +4,26 @@ Created on May 29, 2020
 @author: jishii
 """
 
+import struct
+
 from fprime.util.string_util import format_string_template
 
 from . import serializable_type
+from .bool_type import BoolType
+from .enum_type import EnumType
+from .numerical_types import NumericalType
 from .type_base import DictionaryType
 from .type_exceptions import (
     ArrayLengthException,
+    DeserializeException,
     NotInitializedException,
     TypeMismatchException,
+    TypeRangeException,
 )
 
+# Member types whose serialized size never depends on the value held
+FIXED_SIZE_TYPES = (BoolType, EnumType, NumericalType)
+
 
 class ArrayType(DictionaryType):
     """Generic fixed-size array type representation.
@@ -21,6 +31,18 @@ class ArrayType(DictionaryType):
     Represents a custom named type of a fixed number of like members, each of which are other types in the system.
     """
 
+    __slots__ = ()
+
+    # Struct covering the whole array, only available when members are numerical or enumeration types. Arrays of
+    # numerical types are simple numeric arrays and hold raw python values in _val rather than member type instances.
+    _BATCH_STRUCT = None
+    _IS_SIMPLE_NUMERIC = False
+    # Total size and per-member offsets, only available when members are of a fixed size
+    _TOTAL_SIZE = None
+    _MEMBER_OFFSETS = None
+    # Members that are themselves arrays or serializables format themselves
+    _IS_COMPOSITE_MEMBER = False
+
     @classmethod
     def construct_type(cls, name, member_type, length, format):
         """Constructs a sub-array type
@@ -34,9 +56,31 @@ class ArrayType(DictionaryType):
             length: length of the array subtype
             format: format string for members of the array subtype
         """
-        return DictionaryType.construct_type(
+        array_class = DictionaryType.construct_type(
             cls, name, MEMBER_TYPE=member_type, LENGTH=length, FORMAT=format
         )
+        array_class._IS_COMPOSITE_MEMBER = issubclass(
+            member_type, (serializable_type.SerializableType, ArrayType)
+        )
+        # Static portion of the JSONable form, copied and completed with the values by to_jsonable
+        array_class._JSONABLE_SKELETON = {
+            "name": name,
+            "type": name,
+            "size": length,
+            "format": format,
+        }
+        if issubclass(member_type, FIXED_SIZE_TYPES):
+            member_size = member_type.getMaxSize()
+            array_class._TOTAL_SIZE = member_size * length
+            array_class._MEMBER_OFFSETS = tuple(
+                index * member_size for index in range(length)
+            )
+        if issubclass(member_type, (EnumType, NumericalType)):
+            array_class._BATCH_STRUCT = struct.Struct(
+                ">" + member_type._STRUCT.format.lstrip(">") * length
+            )
+            array_class._IS_SIMPLE_NUMERIC = issubclass(member_type, NumericalType)
+        return array_class
 
     @classmethod
     def validate(cls, val):
@@ -45,8 +89,9 @@ class ArrayType(DictionaryType):
             raise TypeMismatchException(list, type(val))
         if len(val) != cls.LENGTH:
             raise ArrayLengthException(cls.MEMBER_TYPE, cls.LENGTH, len(val))
-        for i in range(cls.LENGTH):
-            cls.MEMBER_TYPE.validate(val[i])
+        validate_member = cls.MEMBER_TYPE.validate
+        for member_val in val:
+            validate_member(member_val)
 
     @property
     def val(self) -> list:
@@ -56,7 +101,11 @@ class ArrayType(DictionaryType):
 
         :return dictionary of member names to python values of member keys
         """
-        return None if self._val is None else [item.val for item in self._val]
+        if self._val is None:
+            return None
+        if self._IS_SIMPLE_NUMERIC:
+            return list(self._val)
+        return [item.val for item in self._val]
 
     @property
     def formatted_val(self) -> list:
@@ -66,13 +115,11 @@ class ArrayType(DictionaryType):
         Note 2: If a member is a serializable will call serializable formatted_val
         :return a formatted array
         """
-        result = []
-        for item in self._val:
-            if isinstance(item, (serializable_type.SerializableType, ArrayType)):
-                result.append(item.formatted_val)
-            else:
-                result.append(format_string_template(self.FORMAT, item.val))
-        return result
+        if self._IS_SIMPLE_NUMERIC:
+            return [format_string_template(self.FORMAT, item) for item in self._val]
+        if self._IS_COMPOSITE_MEMBER:
+            return [item.formatted_val for item in self._val]
+        return [format_string_template(self.FORMAT, item.val) for item in self._val]
 
     @val.setter
     def val(self, val: list):
@@ -84,43 +131,92 @@ class ArrayType(DictionaryType):
         :param val: dictionary containing python types to key names. This
         """
         self.validate(val)
-        items = [self.MEMBER_TYPE(item) for item in val]
-        self._val = items
+        if self._IS_SIMPLE_NUMERIC:
+            self._val = list(val)
+        elif self._TOTAL_SIZE is None:
+            self._val = [self.MEMBER_TYPE(item) for item in val]
+        else:
+            # Fixed-size members (enums, bools) hold nothing beyond their value and were validated above. Store their
+            # values without validating each a second time.
+            items = []
+            for item_val in val:
+                item = self.MEMBER_TYPE()
+                item._val = item_val
+                items.append(item)
+            self._val = items
 
     def to_jsonable(self):
         """
         JSONable array object format
         """
-        return {
-            "name": self.__class__.__name__,
-            "type": self.__class__.__name__,
-            "size": self.LENGTH,
-            "format": self.FORMAT,
-            "values": (
-                None
-                if self._val is None
-                else [member.to_jsonable() for member in self._val]
-            ),
-        }
+        jsonable = self._JSONABLE_SKELETON.copy()
+        jsonable["values"] = None if self._val is None else self._jsonable_values()
+        return jsonable
+
+    def _jsonable_values(self):
+        """Convert the members to JSONable objects, boxing raw numeric values as members on demand"""
+        if self._IS_SIMPLE_NUMERIC:
+            return [self.MEMBER_TYPE(item).to_jsonable() for item in self._val]
+        return [member.to_jsonable() for member in self._val]
 
     def serialize(self):
         """Serialize the array by serializing the elements one by one"""
-        if self.val is None:
+        if self._val is None:
             raise NotInitializedException(type(self))
+        if self._IS_SIMPLE_NUMERIC:
+            return self._BATCH_STRUCT.pack(*self._val)
         return b"".join([item.serialize() for item in self._val])
 
+    def serialize_into(self, buffer, offset):
+        """Serialize the array directly into buffer at offset, packing numerical arrays in one call"""
+        if self._val is None:
+            raise NotInitializedException(type(self))
+        if self._IS_SIMPLE_NUMERIC:
+            self._BATCH_STRUCT.pack_into(buffer, offset, *self._val)
+            return self._BATCH_STRUCT.size
+        start = offset
+        for item in self._val:
+            offset += item.serialize_into(buffer, offset)
+        return offset - start
+
     def deserialize(self, data, offset):
-        """Deserialize the members of the array"""
+        """Deserialize the members of the array. data may be a memoryview and is never copied by the array itself"""
+        if self._BATCH_STRUCT is not None:
+            try:
+                raw_values = self._BATCH_STRUCT.unpack_from(data, offset)
+            except struct.error as err:
+                raise DeserializeException(str(err))
+            if self._IS_SIMPLE_NUMERIC:
+                self._val = list(raw_values)
+                return
+            # Enumeration members: map each raw value back to its member name
+            reverse_dict = self.MEMBER_TYPE._REVERSE_DICT
+            values = []
+            for raw_value in raw_values:
+                key = reverse_dict.get(raw_value)
+                if key is None:
+                    raise TypeRangeException(raw_value)
+                values.append(self.MEMBER_TYPE(key))
+            self._val = values
+            return
         values = []
-        for _ in range(self.LENGTH):
-            item = self.MEMBER_TYPE()
-            item.deserialize(data, offset)
-            offset += item.getSize()
-            values.append(item)
+        if self._MEMBER_OFFSETS is not None:
+            for member_offset in self._MEMBER_OFFSETS:
+                item = self.MEMBER_TYPE()
+                item.deserialize(data, offset + member_offset)
+                values.append(item)
+        else:
+            for _ in range(self.LENGTH):
+                item = self.MEMBER_TYPE()
+                item.deserialize(data, offset)
+                offset += item.getSize()
+                values.append(item)
         self._val = values
 
     def getSize(self):
         """Return the size in bytes of the array"""
+        if self._TOTAL_SIZE is not None:
+            return self._TOTAL_SIZE
         return sum(item.getSize() for item in self._val)
 
     @classmethod
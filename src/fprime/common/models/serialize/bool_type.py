@@ -20,8 +20,11 @@ class BoolType(ValueType):
     is stored as a U8 of 0x00.
     """
 
+    __slots__ = ()
+
     TRUE = 0xFF
     FALSE = 0x00
+    _STRUCT = struct.Struct("B")
 
     @classmethod
     def validate(cls, val):
@@ -33,12 +36,12 @@ class BoolType(ValueType):
         """Serialize a boolean value"""
         if self._val is None:
             raise NotInitializedException(type(self))
-        return struct.pack("B", self.TRUE if self._val else self.FALSE)
+        return self._STRUCT.pack(self.TRUE if self._val else self.FALSE)
 
     def deserialize(self, data, offset):
         """Deserialize boolean value"""
         try:
-            int_val = struct.unpack_from("B", data, offset)[0]
+            int_val = self._STRUCT.unpack_from(data, offset)[0]
             if int_val not in [self.TRUE, self.FALSE]:
                 raise TypeRangeException(int_val)
             self._val = int_val == self.TRUE
@@ -47,7 +50,7 @@ class BoolType(ValueType):
 
     @classmethod
     def getSize(cls):
-        return struct.calcsize("B")
+        return cls._STRUCT.size
 
     @classmethod
     def getMaxSize(cls):
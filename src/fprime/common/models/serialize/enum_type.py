@@ -4,6 +4,7 @@ Created on Dec 18, 2014
 """
 
 import struct
+from types import MappingProxyType
 
 from .type_base import DictionaryType
 from .type_exceptions import (
@@ -15,11 +16,33 @@ from .type_exceptions import (
     InvalidRepresentationTypeException,
     RepresentationTypeRangeException,
 )
-from .numerical_types import IntegerType
+from .numerical_types import (
+    I8Type,
+    I16Type,
+    I32Type,
+    I64Type,
+    U8Type,
+    U16Type,
+    U32Type,
+    U64Type,
+)
 
-REPRESENTATION_TYPE_MAP = {
-    cls.get_canonical_name(): cls for cls in IntegerType.__subclasses__()
-}
+# Read-only map of canonical names to the integer types usable as enumeration representation types
+REPRESENTATION_TYPE_MAP = MappingProxyType(
+    {
+        cls.get_canonical_name(): cls
+        for cls in (
+            I8Type,
+            I16Type,
+            I32Type,
+            I64Type,
+            U8Type,
+            U16Type,
+            U32Type,
+            U64Type,
+        )
+    }
+)
 
 
 class EnumType(DictionaryType):
@@ -31,6 +54,8 @@ class EnumType(DictionaryType):
     containing code based on C enum rules
     """
 
+    __slots__ = ()
+
     @classmethod
     def construct_type(cls, name, enum_dict, rep_type="I32"):
         """Construct the custom enum type
@@ -50,20 +75,41 @@ class EnumType(DictionaryType):
             if not isinstance(enum_dict[member], int):
                 raise TypeMismatchException(int, enum_dict[member])
 
-        if rep_type not in REPRESENTATION_TYPE_MAP.keys():
+        if rep_type not in REPRESENTATION_TYPE_MAP:
             raise InvalidRepresentationTypeException(
                 rep_type, REPRESENTATION_TYPE_MAP.keys()
             )
 
-        for member in enum_dict.keys():
-            type_range = REPRESENTATION_TYPE_MAP[rep_type].range()
-            if enum_dict[member] < type_range[0] or enum_dict[member] > type_range[1]:
+        rep_class = REPRESENTATION_TYPE_MAP[rep_type]
+        type_range = rep_class.range()
+        for member, value in enum_dict.items():
+            if value < type_range[0] or value > type_range[1]:
                 raise RepresentationTypeRangeException(
-                    member, enum_dict[member], rep_type, type_range
+                    member, value, rep_type, type_range
                 )
 
+        # Reverse lookup for deserialization. First member wins when values are aliased, as in C.
+        reverse_dict = {}
+        for member, value in enum_dict.items():
+            reverse_dict.setdefault(value, member)
+        # Serialized form of each member such that serialization is a single lookup
+        rep_struct = rep_class._STRUCT
+        val_bytes = {
+            member: rep_struct.pack(value) for member, value in enum_dict.items()
+        }
+
         return DictionaryType.construct_type(
-            cls, name, ENUM_DICT=enum_dict, REP_TYPE=rep_type
+            cls,
+            name,
+            ENUM_DICT=enum_dict,
+            REP_TYPE=rep_type,
+            _REP_CLS=rep_class,
+            _STRUCT=rep_struct,
+            _UNPACK_FROM=rep_struct.unpack_from,
+            _VAL_BYTES=val_bytes,
+            _REVERSE_DICT=reverse_dict,
+            _KEYS=tuple(enum_dict.keys()),
+            _KEYS_SET=frozenset(enum_dict.keys()),
         )
 
     @classmethod
@@ -71,62 +117,49 @@ class EnumType(DictionaryType):
         """Validate the value passed into the enumeration"""
         if not isinstance(val, str):
             raise TypeMismatchException(str, type(val))
-        if val not in cls.keys():
+        if val not in cls._KEYS_SET:
             raise EnumMismatchException(cls.__class__.__name__, val)
 
     @classmethod
     def keys(cls):
         """
-        Return all the enum key values.
+        Return all the enum key values as a tuple computed when the type was constructed.
         """
-        return list(cls.ENUM_DICT.keys())
+        return cls._KEYS
 
     def serialize(self):
         """
         Serialize the enumeration type using an int type
         """
-        # for enums, take the string value and convert it to
-        # the numeric equivalent
-        if self._val is None or (
-            self._val == "UNDEFINED" and "UNDEFINED" not in self.ENUM_DICT
-        ):
-            raise NotInitializedException(type(self))
-        return struct.pack(
-            REPRESENTATION_TYPE_MAP[self.REP_TYPE].get_serialize_format(),
-            self.ENUM_DICT[self._val],
-        )
+        # for enums, take the string value and look up the precomputed
+        # bytes of its numeric equivalent. None and an undefined
+        # "UNDEFINED" value are not in the table.
+        try:
+            return self._VAL_BYTES[self._val]
+        except KeyError:
+            raise NotInitializedException(type(self)) from None
 
     def deserialize(self, data, offset):
         """
-        Deserialize the enumeration using an int type
+        Deserialize the enumeration using an int type. data may be any buffer (bytes, bytearray, memoryview) and is
+        never copied.
         """
         try:
-            int_val = struct.unpack_from(
-                REPRESENTATION_TYPE_MAP[self.REP_TYPE].get_serialize_format(),
-                data,
-                offset,
-            )[0]
-
+            int_val = self._UNPACK_FROM(data, offset)[0]
         except struct.error:
-            msg = f"Could not deserialize enum value. Needed: {self.getSize()} bytes Found: {len(data[offset:])}"
+            msg = f"Could not deserialize enum value. Needed: {self.getSize()} bytes Found: {max(len(data) - offset, 0)}"
             raise DeserializeException(msg)
-        for key, val in self.ENUM_DICT.items():
-            if int_val == val:
-                self._val = key
-                break
+        key = self._REVERSE_DICT.get(int_val)
         # Value not found, invalid enumeration value
-        else:
+        if key is None:
             raise TypeRangeException(int_val)
+        self._val = key
 
     def getSize(self):
         """Calculates the size based on the size of an integer used to store it"""
-        return struct.calcsize(
-            REPRESENTATION_TYPE_MAP[self.REP_TYPE].get_serialize_format()
-        )
+        return self._STRUCT.size
 
     @classmethod
     def getMaxSize(cls):
         """Maximum size of type"""
-        return struct.calcsize(
-            REPRESENTATION_TYPE_MAP[cls.REP_TYPE].get_serialize_format()
-        )
+        return cls._STRUCT.size
@@ -22,6 +22,15 @@ from .type_exceptions import (
 class NumericalType(ValueType, abc.ABC):
     """Numerical types that can be serialized using struct and are of some power of 2 byte width"""
 
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        """Compile the struct used to (de)serialize each concrete numerical type once and record its size"""
+        super().__init_subclass__(**kwargs)
+        if "get_serialize_format" in vars(cls):
+            cls._STRUCT = struct.Struct(cls.get_serialize_format())
+            cls.SIZE = cls._STRUCT.size
+
     @classmethod
     def get_canonical_name(cls):
         """Returns the fprime C++ name for the type"""
@@ -34,8 +43,8 @@ class NumericalType(ValueType, abc.ABC):
 
     @classmethod
     def getSize(cls):
-        """Gets the size of the integer based on the size specified in the class name"""
-        return int(cls.get_bits() >> 3)  # Divide by 8 quickly
+        """Gets the size of the type as precomputed from its compiled struct"""
+        return cls.SIZE
 
     @classmethod
     def getMaxSize(cls):
@@ -52,12 +61,19 @@ class NumericalType(ValueType, abc.ABC):
         """Serializes this type using struct and the val property"""
         if self._val is None:
             raise NotInitializedException(type(self))
-        return struct.pack(self.get_serialize_format(), self._val)
+        return self._STRUCT.pack(self._val)
+
+    def serialize_into(self, buffer, offset):
+        """Serializes this type directly into buffer at offset using struct"""
+        if self._val is None:
+            raise NotInitializedException(type(self))
+        self._STRUCT.pack_into(buffer, offset, self._val)
+        return self.SIZE
 
     def deserialize(self, data, offset):
         """Serializes this type using struct and the val property"""
         try:
-            self._val = struct.unpack_from(self.get_serialize_format(), data, offset)[0]
+            self._val = self._STRUCT.unpack_from(data, offset)[0]
         except struct.error as err:
             raise DeserializeException(str(err))
 
@@ -65,6 +81,14 @@ class NumericalType(ValueType, abc.ABC):
 class IntegerType(NumericalType, abc.ABC):
     """Base class that represents all integer common functions"""
 
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        """Record the static range bounds of each concrete integer type for use in validation"""
+        super().__init_subclass__(**kwargs)
+        if "range" in vars(cls):
+            cls._MIN, cls._MAX = cls.range()
+
     @classmethod
     @abc.abstractmethod
     def range(cls):
@@ -75,14 +99,15 @@ class IntegerType(NumericalType, abc.ABC):
         """Validates the given integer."""
         if not isinstance(val, int):
             raise TypeMismatchException(int, type(val))
-        min_val, max_val = cls.range()
-        if val < min_val or val > max_val:
+        if val < cls._MIN or val > cls._MAX:
             raise TypeRangeException(val)
 
 
 class FloatType(NumericalType, abc.ABC):
     """Base class that represents all float common functions"""
 
+    __slots__ = ()
+
     @classmethod
     def validate(cls, val):
         """Validates the given integer."""
@@ -93,6 +118,8 @@ class FloatType(NumericalType, abc.ABC):
 class I8Type(IntegerType):
     """Single byte integer type. Represents C chars"""
 
+    __slots__ = ()
+
     @classmethod
     def range(cls):
         """Gets signed/unsigned of this type"""
@@ -112,6 +139,8 @@ class I8Type(IntegerType):
 class I16Type(IntegerType):
     """Double byte integer type. Represents C shorts"""
 
+    __slots__ = ()
+
     @classmethod
     def range(cls):
         """Gets signed/unsigned of this type"""
@@ -131,6 +160,8 @@ class I16Type(IntegerType):
 class I32Type(IntegerType):
     """Four byte integer type. Represents C int32_t,"""
 
+    __slots__ = ()
+
     @classmethod
     def range(cls):
         """Gets signed/unsigned of this type"""
@@ -150,6 +181,8 @@ class I32Type(IntegerType):
 class I64Type(IntegerType):
     """Eight byte integer type. Represents C int64_t,"""
 
+    __slots__ = ()
+
     @classmethod
     def range(cls):
         """Gets signed/unsigned of this type"""
@@ -169,6 +202,8 @@ class I64Type(IntegerType):
 class U8Type(IntegerType):
     """Single byte integer type. Represents C chars"""
 
+    __slots__ = ()
+
     @classmethod
     def range(cls):
         """Gets signed/unsigned of this type"""
@@ -188,6 +223,8 @@ class U8Type(IntegerType):
 class U16Type(IntegerType):
     """Double byte integer type. Represents C shorts"""
 
+    __slots__ = ()
+
     @classmethod
     def range(cls):
         """Gets signed/unsigned of this type"""
@@ -207,6 +244,8 @@ class U16Type(IntegerType):
 class U32Type(IntegerType):
     """Four byte integer type. Represents C unt32_t,"""
 
+    __slots__ = ()
+
     @classmethod
     def range(cls):
         """Gets signed/unsigned of this type"""
@@ -226,6 +265,8 @@ class U32Type(IntegerType):
 class U64Type(IntegerType):
     """Eight byte integer type. Represents C unt64_t,"""
 
+    __slots__ = ()
+
     @classmethod
     def range(cls):
         """Gets signed/unsigned of this type"""
@@ -245,6 +286,8 @@ class U64Type(IntegerType):
 class F32Type(FloatType):
     """Eight byte integer type. Represents C unt64_t,"""
 
+    __slots__ = ()
+
     @classmethod
     def get_bits(cls):
         """Get the bit count of this type"""
@@ -259,6 +302,8 @@ class F32Type(FloatType):
 class F64Type(FloatType):
     """Eight byte integer type. Represents C unt64_t,"""
 
+    __slots__ = ()
+
     @classmethod
     def get_bits(cls):
         """Get the bit count of this type"""
@@ -5,18 +5,87 @@ Created on Dec 18, 2014
 
 """
 
+import struct
+import sys
+from operator import attrgetter
+
 from fprime.util.string_util import format_string_template
 
 from . import array_type
+from .bool_type import BoolType
+from .enum_type import EnumType
+from .numerical_types import NumericalType
 from .type_base import BaseType, DictionaryType
 from .type_exceptions import (
+    DeserializeException,
     IncorrectMembersException,
     MissingMemberException,
     NotInitializedException,
     TypeMismatchException,
+    TypeRangeException,
 )
 
 
+def fixed_size(member_type):
+    """Serialized size of member_type when it does not depend on the value held, None otherwise"""
+    if issubclass(member_type, array_type.FIXED_SIZE_TYPES):
+        return member_type.getMaxSize()
+    if issubclass(member_type, array_type.ArrayType):
+        return member_type._TOTAL_SIZE
+    if issubclass(member_type, SerializableType) and not member_type._VARIABLE_INDICES:
+        return member_type._FIXED_SIZE
+    return None
+
+
+def scalar_codec(member_type):
+    """Struct format of member_type along with functions converting its value to and from the raw packed value
+
+    Conversion functions are None for numerical types, whose values pack as-is. Returns None for types that are not
+    scalar types and thus cannot be packed as part of a combined struct.
+    """
+    if issubclass(member_type, NumericalType):
+        return member_type._STRUCT.format.lstrip(">"), None, None
+    if issubclass(member_type, EnumType):
+        reverse_dict = member_type._REVERSE_DICT
+
+        def decode_enum(raw_value):
+            key = reverse_dict.get(raw_value)
+            if key is None:
+                raise TypeRangeException(raw_value)
+            return key
+
+        return (
+            member_type._STRUCT.format.lstrip(">"),
+            member_type.ENUM_DICT.__getitem__,
+            decode_enum,
+        )
+    if issubclass(member_type, BoolType):
+
+        def encode_bool(value):
+            return member_type.TRUE if value else member_type.FALSE
+
+        def decode_bool(raw_value):
+            if raw_value not in (member_type.TRUE, member_type.FALSE):
+                raise TypeRangeException(raw_value)
+            return raw_value == member_type.TRUE
+
+        return member_type._STRUCT.format.lstrip(">"), encode_bool, decode_bool
+    return None
+
+
+def member_formatter(member_type, member_format):
+    """Function producing the formatted value of a member of member_type given the member object
+
+    Members that are themselves arrays or serializables format themselves. Members without a format string format as
+    str, avoiding template parsing on every call.
+    """
+    if issubclass(member_type, (array_type.ArrayType, SerializableType)):
+        return attrgetter("formatted_val")
+    if member_format is None:
+        return lambda member: str(member.val)
+    return lambda member: format_string_template(member_format, member.val)
+
+
 class SerializableType(DictionaryType):
     """
     Representation of the Serializable type (comparable to the ANY type)
@@ -31,6 +100,26 @@ class SerializableType(DictionaryType):
     The member descriptions can be None
     """
 
+    __slots__ = ()
+
+    # Struct covering every member, only available when all members are scalar (numerical, enum, bool) types. Raw
+    # value converters are only needed when some members are not numerical types, and are None otherwise.
+    _COMBINED_STRUCT = None
+    _COMBINED_ENCODERS = None
+    _COMBINED_DECODERS = None
+    # Validate method and value formatter of each member type, in member order
+    _MEMBER_VALIDATORS = ()
+    # Names of the members a value must supply
+    _REQUIRED_KEYS = frozenset()
+    _MEMBER_FORMATTERS = ()
+    # Whether each member is a scalar (numerical, enum, bool) type holding nothing beyond its value
+    _MEMBER_IS_SCALAR = ()
+    # Serialized size of each fixed-size member, None for members sized per value
+    _MEMBER_SIZES = ()
+    # serialize_into and deserialize functions of each member type, called with the member as first argument
+    _MEMBER_SERIALIZERS = ()
+    _MEMBER_DESERIALIZERS = ()
+
     @classmethod
     def construct_type(cls, name, member_list):
         """Construct a new serializable sub-type
@@ -57,7 +146,71 @@ class SerializableType(DictionaryType):
                 raise TypeMismatchException(str, type(format_string))
             if description is not None and not isinstance(description, str):
                 raise TypeMismatchException(str, type(description))
-        return DictionaryType.construct_type(cls, name, MEMBER_LIST=member_list)
+        # Member names are interned such that dictionary lookups by name compare by identity
+        for member in member_list:
+            member[0] = sys.intern(member[0])
+        member_types = tuple(member[1] for member in member_list)
+        # Split members into those whose size is known up front and those that must be sized per value
+        member_sizes = [fixed_size(member_type) for member_type in member_types]
+        variable_indices = tuple(
+            index for index, size in enumerate(member_sizes) if size is None
+        )
+        total_fixed_size = sum(size for size in member_sizes if size is not None)
+        # When every member is of a fixed size, member offsets are known up front and deserialize need not size each
+        member_offsets = None
+        if not variable_indices:
+            member_offsets = []
+            position = 0
+            for size in member_sizes:
+                member_offsets.append(position)
+                position += size
+            member_offsets = tuple(member_offsets)
+        # Member fields split into parallel tuples such that each hot path iterates only the field it needs
+        serializable_class = DictionaryType.construct_type(
+            cls,
+            name,
+            MEMBER_LIST=member_list,
+            _MEMBER_NAMES=tuple(member[0] for member in member_list),
+            _MEMBER_TYPES=member_types,
+            _MEMBER_FORMATS=tuple(member[2] for member in member_list),
+            _MEMBER_DESCS=tuple(member[3] for member in member_list),
+            _MEMBER_OFFSETS=member_offsets,
+            _FIXED_SIZE=total_fixed_size,
+            _VARIABLE_INDICES=variable_indices,
+        )
+        # Formatting is dispatched per member as decided here, rather than by isinstance checks in formatted_val which
+        # go through the ABC instance check machinery for every member
+        serializable_class._MEMBER_FORMATTERS = tuple(
+            member_formatter(member_type, member_format)
+            for member_type, member_format in zip(
+                member_types, serializable_class._MEMBER_FORMATS
+            )
+        )
+        serializable_class._REQUIRED_KEYS = frozenset(serializable_class._MEMBER_NAMES)
+        # Member validators are resolved once such that validate calls straight into each of them. Members without a
+        # validate of their own (e.g. TimeType) are recorded as None and skipped.
+        serializable_class._MEMBER_VALIDATORS = tuple(
+            getattr(member_type, "validate", None) for member_type in member_types
+        )
+        # Member methods are resolved once on the member types rather than looked up on each member per call
+        serializable_class._MEMBER_SIZES = tuple(member_sizes)
+        serializable_class._MEMBER_SERIALIZERS = tuple(
+            member_type.serialize_into for member_type in member_types
+        )
+        serializable_class._MEMBER_DESERIALIZERS = tuple(
+            member_type.deserialize for member_type in member_types
+        )
+        codecs = [scalar_codec(member_type) for member_type in member_types]
+        serializable_class._MEMBER_IS_SCALAR = tuple(
+            codec is not None for codec in codecs
+        )
+        if None not in codecs:
+            formats, encoders, decoders = zip(*codecs) if codecs else ((), (), ())
+            serializable_class._COMBINED_STRUCT = struct.Struct(">" + "".join(formats))
+            if any(encoder is not None for encoder in encoders):
+                serializable_class._COMBINED_ENCODERS = encoders
+                serializable_class._COMBINED_DECODERS = decoders
+        return serializable_class
 
     @classmethod
     def validate(cls, val):
@@ -65,15 +218,19 @@ class SerializableType(DictionaryType):
         # Ensure that the supplied value is a dictionary
         if not isinstance(val, dict):
             raise TypeMismatchException(dict, type(val))
-        if len(val) != len(cls.MEMBER_LIST):
-            raise IncorrectMembersException([name for name, _, _, _ in cls.MEMBER_LIST])
+        if len(val) != len(cls._MEMBER_NAMES):
+            raise IncorrectMembersException(list(cls._MEMBER_NAMES))
+        # Check all members are present in one set operation, only searching for the missing member on failure
+        if not val.keys() >= cls._REQUIRED_KEYS:
+            raise MissingMemberException(
+                next(name for name in cls._MEMBER_NAMES if name not in val)
+            )
         # Now validate each field as defined via the value
-        for member_name, member_type, _, _ in cls.MEMBER_LIST:
-            try:
-                member_val = val[member_name]
-            except KeyError:
-                raise MissingMemberException(member_name)
-            member_type.validate(member_val)
+        for member_name, validate_member in zip(
+            cls._MEMBER_NAMES, cls._MEMBER_VALIDATORS
+        ):
+            if validate_member is not None:
+                validate_member(val[member_name])
 
     @property
     def val(self) -> dict:
@@ -86,8 +243,8 @@ class SerializableType(DictionaryType):
         if self._val is None:
             return None
         return {
-            member_name: self._val.get(member_name).val
-            for member_name, _, _, _ in self.MEMBER_LIST
+            member_name: member.val
+            for member_name, member in zip(self._MEMBER_NAMES, self._val)
         }
 
     @val.setter
@@ -100,10 +257,19 @@ class SerializableType(DictionaryType):
         :param val: dictionary containing python types to key names. This
         """
         self.validate(val)
-        self._val = {
-            member_name: member_type(val.get(member_name))
-            for member_name, member_type, _, _, in self.MEMBER_LIST
-        }
+        # Members are stored positionally, in the order of the member list. Scalar members were validated above and
+        # hold nothing beyond their value, so their values are stored without validating each a second time.
+        new_value = []
+        for member_name, member_type, is_scalar in zip(
+            self._MEMBER_NAMES, self._MEMBER_TYPES, self._MEMBER_IS_SCALAR
+        ):
+            if is_scalar:
+                member = member_type()
+                member._val = val[member_name]
+            else:
+                member = member_type(val[member_name])
+            new_value.append(member)
+        self._val = new_value
 
     @property
     def formatted_val(self) -> dict:
@@ -113,58 +279,115 @@ class SerializableType(DictionaryType):
         Note 2: If a member is an array will call array formatted_val
         :return a formatted dict
         """
-        result = {}
-        for member_name, _, member_format, _ in self.MEMBER_LIST:
-            value_object = self._val[member_name]
-            if isinstance(value_object, (array_type.ArrayType, SerializableType)):
-                result[member_name] = value_object.formatted_val
-            else:
-                result[member_name] = format_string_template(
-                    member_format, value_object.val
-                )
-        return result
+        return {
+            member_name: formatter(value_object)
+            for member_name, formatter, value_object in zip(
+                self._MEMBER_NAMES, self._MEMBER_FORMATTERS, self._val
+            )
+        }
+
+    def _raw_values(self):
+        """Raw values of the members as packed by the combined struct"""
+        if self._COMBINED_ENCODERS is None:
+            return [member._val for member in self._val]
+        return [
+            member._val if encode is None else encode(member._val)
+            for encode, member in zip(self._COMBINED_ENCODERS, self._val)
+        ]
 
     def serialize(self):
-        """Serializes the members of the serializable"""
+        """Serializes the members of the serializable into a single buffer sized up front"""
         if self._val is None:
             raise NotInitializedException(type(self))
-        return b"".join(
-            [
-                self._val.get(member_name).serialize()
-                for member_name, _, _, _ in self.MEMBER_LIST
-            ]
-        )
+        if self._COMBINED_STRUCT is not None:
+            return self._COMBINED_STRUCT.pack(*self._raw_values())
+        buffer = bytearray(self.getSize())
+        self.serialize_into(buffer, 0)
+        return bytes(buffer)
+
+    def serialize_into(self, buffer, offset):
+        """Serialize the members directly into buffer at offset, each member writing in place"""
+        if self._val is None:
+            raise NotInitializedException(type(self))
+        if self._COMBINED_STRUCT is not None:
+            self._COMBINED_STRUCT.pack_into(buffer, offset, *self._raw_values())
+            return self._COMBINED_STRUCT.size
+        start = offset
+        for serialize_member, member in zip(self._MEMBER_SERIALIZERS, self._val):
+            offset += serialize_member(member, buffer, offset)
+        return offset - start
 
     def deserialize(self, data, offset):
         """Deserialize the values of each of the members"""
-        new_value = {}
-        for member_name, member_type, _, _ in self.MEMBER_LIST:
-            new_member = member_type()
-            new_member.deserialize(data, offset)
-            new_value[member_name] = new_member
-            offset += new_member.getSize()
+        new_value = []
+        if self._COMBINED_STRUCT is not None:
+            try:
+                raw_values = self._COMBINED_STRUCT.unpack_from(data, offset)
+            except struct.error as err:
+                raise DeserializeException(str(err))
+            if self._COMBINED_DECODERS is None:
+                for member_type, raw_value in zip(self._MEMBER_TYPES, raw_values):
+                    new_member = member_type()
+                    new_member._val = raw_value
+                    new_value.append(new_member)
+            else:
+                for member_type, decode, raw_value in zip(
+                    self._MEMBER_TYPES, self._COMBINED_DECODERS, raw_values
+                ):
+                    new_member = member_type()
+                    new_member._val = raw_value if decode is None else decode(raw_value)
+                    new_value.append(new_member)
+        elif self._MEMBER_OFFSETS is not None:
+            for member_type, deserialize_member, member_offset in zip(
+                self._MEMBER_TYPES, self._MEMBER_DESERIALIZERS, self._MEMBER_OFFSETS
+            ):
+                new_member = member_type()
+                deserialize_member(new_member, data, offset + member_offset)
+                new_value.append(new_member)
+        else:
+            for member_type, deserialize_member, member_size in zip(
+                self._MEMBER_TYPES, self._MEMBER_DESERIALIZERS, self._MEMBER_SIZES
+            ):
+                new_member = member_type()
+                deserialize_member(new_member, data, offset)
+                new_value.append(new_member)
+                offset += new_member.getSize() if member_size is None else member_size
         self._val = new_value
 
     def getSize(self):
-        """The size of a struct is the size of all the members"""
-        return sum(self._val.get(name).getSize() for name, _, _, _ in self.MEMBER_LIST)
+        """The size of a struct is the size of all the members, only variable-size members are sized per value"""
+        values = self._val
+        return self._FIXED_SIZE + sum(
+            values[index].getSize() for index in self._VARIABLE_INDICES
+        )
 
     @classmethod
     def getMaxSize(cls):
         """Return the maximum size in bytes of the array"""
-        return sum(member_type.getMaxSize() for _, member_type, _, _ in cls.MEMBER_LIST)
+        return sum(member_type.getMaxSize() for member_type in cls._MEMBER_TYPES)
 
     def to_jsonable(self):
         """
         JSONable type for a serializable
         """
-        members = {}
-        for member_name, member_value, member_format, member_desc in self.MEMBER_LIST:
-            value = (
-                {"value": None}
-                if self._val is None
-                else self._val.get(member_name).to_jsonable()
+        if self._val is None:
+            return {
+                member_name: {
+                    "format": member_format,
+                    "description": member_desc,
+                    "value": None,
+                }
+                for member_name, member_format, member_desc in zip(
+                    self._MEMBER_NAMES, self._MEMBER_FORMATS, self._MEMBER_DESCS
+                )
+            }
+        return {
+            member_name: {
+                "format": member_format,
+                "description": member_desc,
+                **member.to_jsonable(),
+            }
+            for member_name, member_format, member_desc, member in zip(
+                self._MEMBER_NAMES, self._MEMBER_FORMATS, self._MEMBER_DESCS, self._val
             )
-            members[member_name] = {"format": member_format, "description": member_desc}
-            members[member_name].update(value)
-        return members
+        }
@@ -27,6 +27,17 @@ class StringType(type_base.DictionaryType):
     All string types follow this implementation, but have some specific type-based properties: MAX_LENGTH.
     """
 
+    # Serialized form of _val (length prefix and encoded data), kept in step with _val such that it is built only once
+    __slots__ = ("_serialized",)
+
+    # Half-word length prefix preceding the string data
+    _LENGTH_STRUCT = struct.Struct(">H")
+
+    def __init__(self, val=None):
+        """Constructor, with no serialized form until a value is set"""
+        self._serialized = None
+        super().__init__(val)
+
     @classmethod
     def construct_type(cls, name, max_length=None):
         """Constructs a new string type with given name and maximum length"""
@@ -35,48 +46,71 @@ class StringType(type_base.DictionaryType):
     @classmethod
     def validate(cls, val):
         """Validates that this is a string"""
+        cls._encode(val)
+
+    @classmethod
+    def _encode(cls, val):
+        """Validates that this is a string fitting MAX_LENGTH once encoded, returning the encoded string"""
         if not isinstance(val, str):
             raise TypeMismatchException(str, type(val))
-        if cls.MAX_LENGTH is not None and len(val) > cls.MAX_LENGTH:
-            raise StringSizeException(len(val), cls.MAX_LENGTH)
+        encoded = val.encode(DATA_ENCODING)
+        if cls.MAX_LENGTH is not None and len(encoded) > cls.MAX_LENGTH:
+            raise StringSizeException(len(encoded), cls.MAX_LENGTH)
+        return encoded
+
+    @type_base.ValueType.val.setter
+    def val(self, val):
+        """Setter for .val validating and serializing the string once"""
+        encoded = self._encode(val)
+        self._val = val
+        self._serialized = self._LENGTH_STRUCT.pack(len(encoded)) + encoded
 
     def serialize(self):
         """
         Serializes the string in a binary format
         """
         # If val is never set then it is init exception...
-        if self.val is None:
+        if self._val is None:
             raise NotInitializedException(type(self))
-        # Check string size before serializing
-        if self.MAX_LENGTH is not None and len(self.val) > self.MAX_LENGTH:
-            raise StringSizeException(len(self.val), self.MAX_LENGTH)
-        # Pack the string size first then return the encoded data buffer
-        return struct.pack(">H", len(self.val)) + self.val.encode(DATA_ENCODING)
+        # Check string size before serializing, counting encoded bytes as deserialize does
+        val_size = len(self._serialized) - self._LENGTH_STRUCT.size
+        if self.MAX_LENGTH is not None and val_size > self.MAX_LENGTH:
+            raise StringSizeException(val_size, self.MAX_LENGTH)
+        # Serialized form was built when the value was set
+        return self._serialized
 
     def deserialize(self, data, offset):
         """
         Deserializes a string from the given data buffer.
         """
         try:
-            val_size = struct.unpack_from(">H", data, offset)[0]
-            # Deal with not enough data left in the buffer
-            if len(data[offset + 2 :]) < val_size:
-                msg = f"Not enough data to deserialize string data. Needed: {val_size} Left: {len(data[offset + 2:])}"
+            val_size = self._LENGTH_STRUCT.unpack_from(data, offset)[0]
+            end = offset + 2 + val_size
+            # Deal with not enough data left in the buffer, computing what is left without slicing the buffer
+            remaining = len(data) - offset - 2
+            if val_size > remaining:
+                msg = f"Not enough data to deserialize string data. Needed: {val_size} Left: {remaining}"
                 raise DeserializeException(msg)
             # Deal with a string that is larger than max string
             if self.MAX_LENGTH is not None and val_size > self.MAX_LENGTH:
                 raise StringSizeException(val_size, self.MAX_LENGTH)
-            self.val = data[offset + 2 : offset + 2 + val_size].decode(DATA_ENCODING)
+            # Size was checked above, so the decoded string needs no further validation. Decoding happens before any
+            # assignment such that a decode failure leaves this object unchanged.
+            text = str(data[offset + 2 : end], DATA_ENCODING)
+            self._serialized = bytes(data[offset:end])
+            self._val = text
         except struct.error:
             raise DeserializeException("Not enough bytes to deserialize string length.")
 
     def getSize(self):
         """
-        Get the size of this object
+        Get the size of this object as serialized, counting encoded bytes rather than characters
         """
-        return struct.calcsize(">H") + len(self.val)
+        if self._serialized is None:
+            raise NotInitializedException(type(self))
+        return len(self._serialized)
 
     @classmethod
     def getMaxSize(cls):
         """Get maximum size of the type"""
-        return struct.calcsize(">H") + cls.MAX_LENGTH
+        return cls._LENGTH_STRUCT.size + cls.MAX_LENGTH
@@ -45,6 +45,9 @@ TimeBase = Enum(
     },
 )
 
+# Time bases whose time tags can be converted to a datetime, built once rather than on every conversion
+DATETIME_TIME_BASES = frozenset((TimeBase.TB_WORKSTATION_TIME, TimeBase.TB_SC_TIME))
+
 
 class TimeType(type_base.BaseType):
     """
@@ -58,6 +61,8 @@ class TimeType(type_base.BaseType):
     a description of this behavior.  See comparison functions at the end.
     """
 
+    __slots__ = ("__timeBase", "__timeContext", "__secs", "__usecs")
+
     def __init__(self, time_base=0, time_context=0, seconds=0, useconds=0):
         """
         Constructor
@@ -315,7 +320,7 @@ class TimeType(type_base.BaseType):
         tb = TimeBase(self.__timeBase.val)
         dt = None
 
-        if tb in [TimeBase["TB_WORKSTATION_TIME"], TimeBase["TB_SC_TIME"]]:
+        if tb in DATETIME_TIME_BASES:
             # This finds the local time corresponding to the timestamp and
             # timezone object, or local time zone if tz=None
             dt = datetime.datetime.fromtimestamp(self.__secs.val, tz)
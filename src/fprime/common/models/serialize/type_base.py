@@ -15,6 +15,8 @@ class BaseType(abc.ABC):
     An abstract base defining the methods supported by all base classes.
     """
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def serialize(self):
         """
@@ -22,6 +24,19 @@ class BaseType(abc.ABC):
         """
         raise AbstractMethodException("serialize")
 
+    def serialize_into(self, buffer, offset):
+        """
+        Serializes the current object into a preallocated bytearray at the given offset. Types able to pack in place
+        override this default, which copies the output of serialize.
+
+        :param buffer: bytearray to write into
+        :param offset: offset into buffer to start writing at
+        :return: number of bytes written
+        """
+        data = self.serialize()
+        buffer[offset : offset + len(data)] = data
+        return len(data)
+
     @abc.abstractmethod
     def deserialize(self, data, offset):
         """
@@ -60,6 +75,8 @@ class ValueType(BaseType):
     reading from the .val member.
     """
 
+    __slots__ = ("_val",)
+
     def __init__(self, val=None):
         """Defines the single value"""
         self._val = None
@@ -109,9 +126,12 @@ class DictionaryType(ValueType, abc.ABC):
     access to primitive types (U8, F32, etc) and the definitions of theses types is global, other types complete
     specification comes from the dictionary itself. String set max-lengths per project, serializable fields are defined,
     and enumeration values are enumerated. This class is designed to take base complex types (StringType, etc) and build
-    dynamic subclasses for the given dictionary defined type.
+    dynamic subclasses for the given dictionary defined type. Constructed types declare empty __slots__ such that their
+    instances carry only the _val slot and no per-instance __dict__.
     """
 
+    __slots__ = ()
+
     _CONSTRUCTS = {}
 
     @classmethod
@@ -134,17 +154,15 @@ class DictionaryType(ValueType, abc.ABC):
         assert (
             parent_class != DictionaryType
         ), "Cannot build dictionary type from dictionary type directly"
-        construct, original_properties = cls._CONSTRUCTS.get(
-            name, (type(name, (parent_class,), class_properties), class_properties)
-        )
-        # Validate both new properties against original properties and against what is set on original class
-        assert (
-            original_properties == class_properties
-        ), "Different class properties specified"
-        for attribute, value in class_properties.items():
-            previous_value = getattr(construct, attribute, None)
+        previous = cls._CONSTRUCTS.get(name)
+        # Previously defined types are reused as long as the definitions match. The original class was built from the
+        # original properties, so comparing those properties is sufficient to ensure it carries the new ones.
+        if previous is not None:
+            construct, original_properties = previous
             assert (
-                previous_value == value
-            ), f"Class {name} differs by attribute {attribute}. {previous_value} vs {value}"
+                original_properties == class_properties
+            ), f"Class {name} defined with different class properties"
+            return construct
+        construct = type(name, (parent_class,), {"__slots__": (), **class_properties})
         cls._CONSTRUCTS[name] = (construct, class_properties)
         return construct
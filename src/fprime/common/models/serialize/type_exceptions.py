@@ -14,32 +14,36 @@ class TypeException(FprimeException):
 
     def __init__(self, val):
         super().__init__(val)
-        self.except_msg = val
+
+    @property
+    def except_msg(self):
+        """Exception message, read from the exception arguments rather than stored a second time per instance"""
+        return self.args[0]
 
     def getMsg(self):
         """Gets the exception message"""
-        return self.except_msg
+        return self.args[0]
 
 
 class AbstractMethodException(TypeException):
     """Not implemented exception under another name"""
 
     def __init__(self, val):
-        super().__init__(f"{str(val)} must be implemented since it is abstract!")
+        super().__init__(f"{val} must be implemented since it is abstract!")
 
 
 class TypeRangeException(TypeException):
     """Value is out of range"""
 
     def __init__(self, val):
-        super().__init__(f"Value {str(val)} out of range!")
+        super().__init__(f"Value {val} out of range!")
 
 
 class StringSizeException(TypeException):
     """String size is to large for defined type"""
 
     def __init__(self, size, max_size):
-        super().__init__(f"String size {str(size)} is greater than {str(max_size)}!")
+        super().__init__(f"String size {size} is greater than {max_size}!")
 
 
 class TypeMismatchException(TypeException):
@@ -113,8 +117,7 @@ class ArgLengthMismatchException(TypeException):
 
     def __init__(self, arg_length_actual, arg_length_given):
         super().__init__(
-            "%d args provided, but command expects %d args!"
-            % (arg_length_given, arg_length_actual)
+            f"{arg_length_given} args provided, but command expects {arg_length_actual} args!"
         )
 
 
@@ -123,8 +126,7 @@ class CompoundTypeLengthMismatchException(TypeException):
 
     def __init__(self, field_length_actual, field_length_given):
         super().__init__(
-            "%d fields provided, but compound type expects %d fields!"
-            % (field_length_given, field_length_actual)
+            f"{field_length_given} fields provided, but compound type expects {field_length_actual} fields!"
         )
 
 
@@ -133,16 +135,16 @@ class InvalidRepresentationTypeException(TypeException):
 
     def __init__(self, given_rep_type, types):
         super().__init__(
-            "Representation type {} not found in F prime types ({})"
-        ).format(given_rep_type, str(types))
+            f"Representation type {given_rep_type} not found in F prime types ({', '.join(types)})"
+        )
 
 
 class RepresentationTypeRangeException(TypeException):
     """Enumeration member is out of range of the representation type"""
 
-    def __init__(self, key, value, given_rep_type, range):
+    def __init__(self, key, value, given_rep_type, rep_range):
+        low, high = rep_range
         super().__init__(
-            "Enumeration member {} with value {} is out of range of representation type {} ({}-{})".format(
-                key, value, given_rep_type, *range
-            )
+            f"Enumeration member {key} with value {value} is out of range of representation type {given_rep_type} "
+            f"({low}-{high})"
         )
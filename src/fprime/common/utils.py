@@ -3,26 +3,62 @@
 @author thomas-bc
 """
 
+import re
 from pathlib import Path
 
+# Answers accepted by confirm, where no input defaults to yes
+YES_ANSWERS = frozenset(("y", "yes", ""))
+NO_ANSWERS = frozenset(("n", "no"))
+
+# Characters rejected in names by is_valid_name, in the order they are reported. Names are scanned once by the
+# compiled character class.
+INVALID_NAME_CHARACTERS = "#%&{}/\\<>*? $!'\":@+`|=-"
+INVALID_NAME_REGEX = re.compile(f"[{re.escape(INVALID_NAME_CHARACTERS)}]")
+
 
 def confirm(msg):
     """Ask user for a yes or no input after displaying the given message"""
     # Loop "forever" intended
     while True:
         confirm_input = input(msg + " (yes/no) [yes]: ")
-        # Default to yes when no input
-        if confirm_input.lower() in ["y", "yes", ""]:
+        answer = confirm_input.lower()
+        if answer in YES_ANSWERS:
             return True
-        if confirm_input.lower() in ["n", "no"]:
+        if answer in NO_ANSWERS:
             return False
         print(f"{confirm_input} is invalid.  Please use 'yes' or 'no'")
 
 
 def replace_contents(filename, what, replacement, count=1):
-    """Replace the first instance of what with replacement in filename"""
-    changelog = Path(filename).read_text()
-    with open(filename, "w") as fh:
-        new_file = changelog.replace(what, replacement, count)
-        fh.write(new_file)
-        return new_file != changelog
+    """Replace the first instance of what with replacement in filename. Returns whether the file was changed.
+
+    The file is only rewritten when the replacement changes its contents.
+    """
+    path = Path(filename)
+    contents = path.read_text()
+    new_contents = contents.replace(what, replacement, count)
+    if new_contents == contents:
+        return False
+    path.write_text(new_contents)
+    return True
+
+
+def is_valid_name(word: str):
+    """Return the first character of INVALID_NAME_CHARACTERS found in word, or "valid" if there is none"""
+    if not isinstance(word, str):
+        raise ValueError("Incorrect usage of is_valid_name")
+    found = set(INVALID_NAME_REGEX.findall(word))
+    if not found:
+        return "valid"
+    return next(char for char in INVALID_NAME_CHARACTERS if char in found)
+
+
+def validate_name(name: str, kind: str):
+    """Raise a ValueError if name, the name of a new kind of item (e.g. "component"), is not valid
+
+    Shared by the pre-generation hooks of the builtin cookiecutter templates.
+    """
+    if is_valid_name(name) != "valid":
+        raise ValueError(
+            f"Unacceptable {kind} name: {name}. Do not use spaces or special characters"
+        )
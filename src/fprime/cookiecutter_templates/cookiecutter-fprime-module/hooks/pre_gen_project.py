@@ -1,8 +1,3 @@
-from fprime.util.cookiecutter_wrapper import is_valid_name
+from fprime.common.utils import validate_name
 
-name = "{{ cookiecutter.module_name }}"
-
-if is_valid_name(name) != "valid":
-    raise ValueError(
-        f"Unacceptable module name: {name}. Do not use spaces or special characters"
-    )
+validate_name("{{ cookiecutter.module_name }}", "module")
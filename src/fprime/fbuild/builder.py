@@ -174,11 +174,11 @@ class Build:
                 self.build_dir,
             )
         with open(hashes_file) as file_handle:
-            lines = filter(
-                lambda line: hash_value == int(line.split(" ")[-1], 0),
-                file_handle.readlines(),
-            )
-        return list(lines)
+            return [
+                line
+                for line in file_handle
+                if hash_value == int(line.rpartition(" ")[2], 0)
+            ]
 
     def get_build_cache(self) -> Path:
         """Generates build cache path for this build
@@ -207,21 +207,16 @@ class Build:
         Returns:
             Build information dictionary
         """
-        temp_targets = Target.get_all_targets()
-        # Remove targets that are not supported given the builder and context
-        temp_targets = [
-            target for target in temp_targets if target.is_supported(self, context)
-        ]
-        # Now filter for local scope
+        all_targets = Target.get_all_targets()
+        # Filter for local scope first, such that support is only checked for the targets that are reported by it
         local_targets = [
             target
-            for target in temp_targets
-            if target.scope in [TargetScope.LOCAL, TargetScope.BOTH]
+            for target in all_targets
+            if target.scope in (TargetScope.LOCAL, TargetScope.BOTH)
+            and target.is_supported(self, context)
         ]
         global_targets = [
-            target
-            for target in Target.get_all_targets()
-            if target.scope == TargetScope.GLOBAL
+            target for target in all_targets if target.scope == TargetScope.GLOBAL
         ]
         try:
             auto_location = self.get_build_cache_path(context)
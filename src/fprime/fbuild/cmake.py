@@ -35,6 +35,11 @@ class CMakeHandler:
         "FPRIME_LIBRARY_LOCATIONS",
         "FPRIME_FRAMEWORK_PATH",
     ]
+    CACHE_ENTRY_REGEX = re.compile("([^:]+):([^=]*)=(.*)")
+    # Cache entry types that `cmake -N -LA` does not list
+    HIDDEN_CACHE_TYPES = ("INTERNAL", "STATIC")
+    MODULE_TRANSLATION = str.maketrans({".": None, os.sep: "_"})
+    _cmake_found = False
 
     def __init__(self):
         """Instantiate a basic CMake handler"""
@@ -42,12 +47,22 @@ class CMakeHandler:
         self._cmake_cache = None
         self.verbose = False
         self.cached_help_targets = []
+        # Probe for the CMake executable once per process, as every build (e.g. normal and unit test) creates a handler
+        if CMakeHandler._cmake_found:
+            return
+        # The help text itself is discarded rather than buffered through a pseudo-terminal, only errors are kept
         try:
-            self._run_cmake(["--help"], print_output=False)
-        except Exception as exc:
+            subprocess.run(
+                ["cmake", "--help"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                check=True,
+            )
+        except (OSError, subprocess.CalledProcessError) as exc:
             raise CMakeExecutionException(
                 "CMake executable 'cmake' not found", str(exc), printed=False
             ) from exc
+        CMakeHandler._cmake_found = True
 
     def set_verbose(self, verbose):
         """Sets verbosity"""
@@ -302,11 +317,8 @@ class CMakeHandler:
             CMake module name in format x_y_z
         """
         project_relative_path = self.get_project_relative_path(path, build_dir)
-        module = project_relative_path.replace(
-            ".", ""
-        )  # Handles case where relative path is exactly "."
-        module = module.replace(os.sep, "_")
-        return module
+        # Drops "." (handles case where relative path is exactly ".") and maps separators to "_" in a single pass
+        return project_relative_path.translate(CMakeHandler.MODULE_TRANSLATION)
 
     def get_project_relative_path(self, path, build_dir):
         """Gets the path relative to the cmake setup, or raises CMakeOrphanException
@@ -424,8 +436,12 @@ class CMakeHandler:
     def _read_cache(self, build_dir):
         """
         Reads the cache from the associated build_dir. This will return a dictionary of cache variable name to
-        its value. The first run will call cmake to extract the cache and cache it internally. Subsequent
-        calls will return the cached cache.
+        its value. The first run will parse CMakeCache.txt and cache it internally. Subsequent calls will return the
+        cached cache.
+
+        Note: CMakeCache.txt is read directly rather than through `cmake -N -LA`, which parses the same file but costs
+        a process launch. Entries are in the same `KEY:TYPE=VALUE` form. Internal and static entries, including the
+        `<KEY>-ADVANCED` markers, are skipped as `cmake -N -LA` does not list them.
 
         :param build_dir: build directory to harvest for cache variables
         :return: {<cmake cache variable>: <cmake cache value>}
@@ -433,15 +449,23 @@ class CMakeHandler:
         if self._cmake_cache is not None:
             return self._cmake_cache
 
-        reg = re.compile("([^:]+):[^=]*=(.*)")
         # Check that the build_dir is properly setup
         self._cmake_validate_build_dir(build_dir)
-        stdout, _ = self._run_cmake(["-LA"], workdir=build_dir, print_output=False)
-        # Scan for lines in stdout that have non-None matches for the above regular expression
-        valid_matches = filter(lambda item: item is not None, map(reg.match, stdout))
+        with open(
+            os.path.join(build_dir, "CMakeCache.txt"), encoding="utf8"
+        ) as file_handle:
+            # Skip comment lines, which may themselves contain ':' and '='
+            entries = [line for line in file_handle if not line.startswith(("//", "#"))]
+        # Scan for lines in the cache that have non-None matches for CACHE_ENTRY_REGEX, keeping the listed entries
+        valid_matches = filter(
+            lambda item: item is not None
+            and item.group(2) not in CMakeHandler.HIDDEN_CACHE_TYPES
+            and not item.group(1).endswith("-ADVANCED"),
+            map(CMakeHandler.CACHE_ENTRY_REGEX.match, entries),
+        )
         # Return the dictionary composed from the match groups
         self._cmake_cache = dict(
-            map(lambda match: (match.group(1), match.group(2)), valid_matches)
+            map(lambda match: (match.group(1), match.group(3)), valid_matches)
         )
         return self._cmake_cache
 
@@ -458,10 +482,7 @@ class CMakeHandler:
             raise CMakeProjectException(source_dir, "No CMakeLists.txt is defined")
         # Test the cmake_file for project(
         with open(cmake_file, encoding="utf8") as file_handle:
-            project_lines = list(
-                filter(lambda line: "project(" in line, file_handle.readlines())
-            )
-            if not project_lines:
+            if "project(" not in file_handle.read():
                 raise CMakeProjectException(
                     source_dir, f"No 'project()' calls in {cmake_file}"
                 )
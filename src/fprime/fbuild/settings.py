@@ -214,16 +214,16 @@ class IniSettings:
         del settings["_cmake_project_root"]
 
         # add _fprime_packages to library locations
+        packages_dir = settings["project_root"] / "_fprime_packages"
         try:
-            if os.path.exists(settings["project_root"] / "_fprime_packages"):
-                # glob all folders
-                for folder in os.listdir(settings["project_root"] / "_fprime_packages"):
-                    settings["library_locations"].append(
-                        Path(settings["project_root"] / "_fprime_packages" / folder)
-                    )
+            package_folders = os.listdir(packages_dir)
         except FileNotFoundError:
             # we shouldn't error out if the _fprime_packages folder doesn't exist
-            pass
+            package_folders = []
+        # New list such that the shared default library locations list is never extended in place
+        settings["library_locations"] = settings["library_locations"] + [
+            packages_dir / folder for folder in package_folders
+        ]
 
         return settings
 
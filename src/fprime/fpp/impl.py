@@ -71,7 +71,9 @@ def fpp_generate_implementation(
         ),
     )
 
-    # Format files if clang-format is available
+    # Format files if requested and clang-format is available
+    if not apply_formatting:
+        return 0
     format_file = build.settings.get("framework_path", Path(".")) / ".clang-format"
     if not format_file.is_file():
         print(
@@ -80,8 +82,8 @@ def fpp_generate_implementation(
         return 0
 
     clang_formatter = ClangFormatter("clang-format", format_file, {"backup": False})
-    if apply_formatting and clang_formatter.is_supported():
-        for line in gen_files.readlines():
+    if clang_formatter.is_supported():
+        for line in gen_files:
             # FPP --names outputs a list of file names. output_dir is added to get relative path
             filename = Path(line.decode("utf-8").strip())
             clang_formatter.stage_file(output_dir / filename)
@@ -2,7 +2,7 @@ import subprocess
 import os
 
 
-def fpp_depend(cache_folder, input_file, locs_files) -> str:
+def fpp_depend(cache_folder, input_file, locs_files) -> int:
     """
     This function calculates the dependencies for an fpp file using fprime-util to get
     the location of the build cache fpp-depend.
@@ -12,42 +12,39 @@ def fpp_depend(cache_folder, input_file, locs_files) -> str:
         locs_file: The locs.fpp file to use for dependency calculation
 
     Returns:
-        A string of dependencies for the input file
+        0 on success, with the dependencies written into cache_folder, or 1 if fpp-depend failed
     """
 
     print(f"[fpp] Calculating fpp dependencies for {os.path.basename(input_file)}...")
 
     try:
-        fppDep = subprocess.run(
-            ["fpp-depend", input_file]
-            + locs_files
-            + [
-                "-d",
-                f"{cache_folder}/direct.txt",
-                "-m",
-                f"{cache_folder}/missing.txt",
-                "-f",
-                f"{cache_folder}/framework.txt",
-                "-g",
-                f"{cache_folder}/generated.txt",
-                "-i",
-                f"{cache_folder}/include.txt",
-                "-u",
-                f"{cache_folder}/unittest.txt",
-                "-a",
-            ],
-            check=True,
-            stdout=subprocess.PIPE,
-        )
-
-        with open(f"{cache_folder}/stdout.txt", "w") as f:
-            f.write(fppDep.stdout.decode("utf-8"))
-
+        # fpp-depend writes its output straight into the cache file rather than through a pipe and a decoded copy
+        with open(f"{cache_folder}/stdout.txt", "wb") as f:
+            subprocess.run(
+                ["fpp-depend", input_file]
+                + locs_files
+                + [
+                    "-d",
+                    f"{cache_folder}/direct.txt",
+                    "-m",
+                    f"{cache_folder}/missing.txt",
+                    "-f",
+                    f"{cache_folder}/framework.txt",
+                    "-g",
+                    f"{cache_folder}/generated.txt",
+                    "-i",
+                    f"{cache_folder}/include.txt",
+                    "-u",
+                    f"{cache_folder}/unittest.txt",
+                    "-a",
+                ],
+                check=True,
+                stdout=f,
+            )
     except subprocess.CalledProcessError as e:
         print(f"[ERR] fpp-depend failed with error: {e}")
         return 1
-
-    raise Exception("fpp-depend failed")
+    return 0
 
 
 def compute_simple_dependencies(locs_file, input):
@@ -83,7 +80,7 @@ def fpp_to_json(input_file):
     cmdS = ["fpp-to-json", input_file, "-s"]
 
     try:
-        subprocess.run(cmdS, check=True, stdout=subprocess.PIPE)
+        subprocess.run(cmdS, check=True, stdout=subprocess.DEVNULL)
     except subprocess.CalledProcessError as e:
         raise Exception(f"[ERR] fpp-to-json pt2 failed with error: {e}")
 
@@ -176,25 +176,22 @@ def parse_struct(constant_JSON):
 
 
 def openFppFile(path):
-    if not os.path.isabs(path):
-        path = str(Path(path).resolve())
+    filePath = Path(path)
+    if not filePath.is_absolute():
+        filePath = filePath.resolve()
 
-    pathDir = os.path.dirname(path)
-    fileBasename = os.path.basename(path)
-    folderName = f"/{fileBasename.split('.')[0]}Cache"
+    pathDir = filePath.parent
+    pathToFolder = pathDir / f"{filePath.name.partition('.')[0]}Cache"
 
-    pathToFolder = pathDir + folderName
-
-    if not os.path.exists(pathToFolder):
-        try:
-            os.mkdir(pathToFolder)
-        except OSError as e:
-            raise Exception("Creation of the directory %s failed" % (pathToFolder))
+    try:
+        pathToFolder.mkdir(exist_ok=True)
+    except OSError as e:
+        raise Exception("Creation of the directory %s failed" % (pathToFolder))
 
     os.chdir(pathToFolder)
 
     if not os.path.exists("fpp-ast.json"):
-        fpp.fpp_to_json(path)
+        fpp.fpp_to_json(str(filePath))
 
     # parse json
     with open("fpp-ast.json", "r") as f:
@@ -4,20 +4,17 @@
 """
 
 import argparse
+import os
 import shutil
 import subprocess
 import tempfile
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Callable, Dict, List, Tuple
 
 from fprime.fpp.common import FppUtility
 
-try:
-    from fprime_visual.flask.app import construct_app
-except ImportError:
-    construct_app = None
-
 
 def run_fprime_visualize(
     build: "Build",
@@ -39,14 +36,18 @@ def run_fprime_visualize(
         __: unused make_args
         ___: unused pass-through arguments
     """
-    if construct_app is None:
-        raise ModuleNotFoundError(
-            "fprime-visual is not installed. Please install with `pip install fprime-visual`"
-        )
-
+    # The path lookup is checked first as it is far cheaper than importing fprime-visual
     if not (shutil.which("fpl-convert-xml") and shutil.which("fpl-layout")):
         raise FileNotFoundError(
-            "fpl-layout is not installed. Please install with `pip install fprime-fpp>1.2.0`"
+            "fpl-layout is not installed. Please install with `pip install 'fprime-fpp>1.2.0'`"
+        )
+
+    # Imported here as fprime-visual pulls in flask, which would otherwise slow the startup of every fprime-util command
+    try:
+        from fprime_visual.flask.app import construct_app
+    except ImportError:
+        raise ModuleNotFoundError(
+            "fprime-visual is not installed. Please install with `pip install fprime-visual`"
         )
 
     # Set up working directory using specified directory, or create a temporary one
@@ -95,49 +96,47 @@ def run_fprime_visualize(
         topology_txt = viz_cache / f"{topology_name}Topology.txt"
         topology_json = viz_cache / f"{topology_name}Topology.json"
 
-        # Execute: fpl-convert-xml Topology.xml > Topology.txt
-        with open(topology_txt.resolve(), "w") as txt_file:
-            subprocess.run(
-                ["fpl-convert-xml", topology_xml.resolve()], stdout=txt_file, check=True
-            )
-
-        # Execute: fpl-layout < Topology.txt > Topology.json
-        with open(topology_json.resolve(), "w") as json_file:
-            with open(topology_txt.resolve(), "r") as txt_file:
-                subprocess.run(
-                    ["fpl-layout"], stdin=txt_file, stdout=json_file, check=True
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            # The full topology layout does not depend on subtopology extraction, so it runs while extraction proceeds
+            layouts = [
+                executor.submit(
+                    layout_topology, topology_xml, topology_txt, topology_json
+                )
+            ]
+
+            print("Extracting subtopologies...")
+            try:
+                extract_cache.mkdir(parents=True, exist_ok=True)
+            except PermissionError:
+                raise PermissionError(
+                    f"Unable to write to {viz_cache.resolve()}. Use --working-dir to set a different location."
                 )
 
-        print("Extracting subtopologies...")
-        try:
-            extract_cache.mkdir(parents=True, exist_ok=True)
-        except PermissionError:
-            raise PermissionError(
-                f"Unable to write to {viz_cache.resolve()}. Use --working-dir to set a different location."
+            # Execute: fpl-extract-xml -d extracted/ Topology.xml
+            subprocess.run(
+                [
+                    "fpl-extract-xml",
+                    "-d",
+                    extract_cache.resolve(),
+                    topology_xml.resolve(),
+                ],
+                check=True,
             )
-
-        # Execute: fpl-extract-xml -d extracted/ Topology.xml
-        subprocess.run(
-            ["fpl-extract-xml", "-d", extract_cache.resolve(), topology_xml.resolve()],
-            check=True,
-        )
-        subtopologies = list(extract_cache.glob("*.xml"))
-        for subtopology in subtopologies:
-            # Execute: fpl-convert-xml subtopology.xml > subtopology.txt
-            subtopology_txt = extract_cache / f"{subtopology.stem}.txt"
-            with open(subtopology_txt.resolve(), "w") as txt_file:
-                subprocess.run(
-                    ["fpl-convert-xml", subtopology.resolve()],
-                    stdout=txt_file,
-                    check=True,
+            # Listed up front as the layouts write into the same directory while running
+            subtopologies = list(extract_cache.glob("*.xml"))
+            # Subtopologies are independent of one another, so their layouts run concurrently too
+            layouts.extend(
+                executor.submit(
+                    layout_topology,
+                    subtopology,
+                    extract_cache / f"{subtopology.stem}.txt",
+                    viz_cache / f"{subtopology.stem}.json",
                 )
-            # Execute: fpl-layout < subtopology.txt > subtopology.json
-            subtopology_json = viz_cache / f"{subtopology.stem}.json"
-            with open(subtopology_json.resolve(), "w") as json_file:
-                with open(subtopology_txt.resolve(), "r") as txt_file:
-                    subprocess.run(
-                        ["fpl-layout"], stdin=txt_file, stdout=json_file, check=True
-                    )
+                for subtopology in subtopologies
+            )
+            # Collecting the results re-raises any failure from the worker threads
+            for layout in layouts:
+                layout.result()
         source_dirs.append(viz_cache)
     source_resolved = [str(source.resolve()) for source in source_dirs]
     print("[INFO] Starting fprime-visual server...")
@@ -152,6 +151,28 @@ def run_fprime_visualize(
     return 0
 
 
+def layout_topology(topology_xml: Path, topology_txt: Path, topology_json: Path):
+    """Run the fpl-convert-xml and fpl-layout utilities to produce the layout of a single topology
+
+    Args:
+        topology_xml: topology XML file to lay out
+        topology_txt: path of the intermediate fpl-convert-xml output
+        topology_json: path of the layout JSON output
+    """
+    # Execute: fpl-convert-xml Topology.xml > Topology.txt
+    converted = subprocess.run(
+        ["fpl-convert-xml", topology_xml.resolve()],
+        stdout=subprocess.PIPE,
+        check=True,
+    ).stdout
+    topology_txt.resolve().write_bytes(converted)
+
+    # Execute: fpl-layout < Topology.txt > Topology.json
+    # The converted text is piped from memory rather than re-reading the file just written
+    with open(topology_json.resolve(), "w") as json_file:
+        subprocess.run(["fpl-layout"], input=converted, stdout=json_file, check=True)
+
+
 def add_fpp_viz_parsers(
     subparsers, common: argparse.ArgumentParser
 ) -> Tuple[Dict[str, Callable], Dict[str, argparse.ArgumentParser]]:
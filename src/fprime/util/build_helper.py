@@ -14,33 +14,35 @@ are supported herein:
 @author mstarch
 """
 
+from importlib.metadata import PackageNotFoundError, version as installed_version
 from pathlib import Path
+from typing import Sequence
 
 from fprime.fbuild.builder import Build, BuildType
 from fprime.fbuild.cli import get_target
 from fprime.fbuild.target import NoSuchTargetException
 
-from .versioning import VersionException, get_version, FPRIME_PIP_PACKAGES
+from .versioning import (
+    VersionException,
+    get_version,
+    read_requirements,
+    FPRIME_PIP_PACKAGES,
+)
 
-# Attempt to get pkg_resources from "setuptools"
-try:
-    import pkg_resources
-except ImportError:
-    pkg_resources = None
 
-
-def package_version_check(package: str, requirement_path: Path):
+def package_version_check(
+    package: str, requirement_path: Path, requirement_lines: Sequence[str] = None
+):
     """Checks the version of the packages installed match the expected packages of the fprime aggregate package"""
-    expected_version = get_version(package, requirement_path).lstrip(
-        "v"
-    )  # Python version
+    expected_version = get_version(package, requirement_path, requirement_lines)
+    expected_version = expected_version.lstrip("v")  # Python version
     try:
-        version = pkg_resources.get_distribution(package).version
+        version = installed_version(package)
         if version != expected_version:
             print(
                 f"[WARNING] {package} has unexpected version. Expected: {expected_version} found {version}"
             )
-    except pkg_resources.DistributionNotFound:
+    except PackageNotFoundError:
         print(f"[WARNING] {package} is not installed")
 
 
@@ -63,16 +65,14 @@ def validate_tools_from_requirements(build: Build):
             f"[WARNING] Could not find 'requirements.txt' in: {possibilities}. Will not check tool versions."
         )
         return
-    # Pre-roll import errors from pkg_resources
-    if pkg_resources is None:
-        print("[WARNING] Cannot import 'pkg_resources'. Will not check tool versions.")
-        return
-
-    # Now check each required tool for fprime
+    # Now check each required tool for fprime, reading each requirements file once for this check
+    requirement_lines = {}
     for tool in FPRIME_PIP_PACKAGES:
         for possible in possibilities:
             try:
-                package_version_check(tool, possible)
+                if possible not in requirement_lines:
+                    requirement_lines[possible] = read_requirements(possible)
+                package_version_check(tool, possible, requirement_lines[possible])
                 break
             except (OSError, VersionException) as exc:
                 message = f"[WARNING] {exc}"
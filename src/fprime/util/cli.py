@@ -28,6 +28,9 @@ from fprime.util.help_text import HelpText
 from fprime.fpp.visualize import add_fpp_viz_parsers
 from fprime.fpp.impl import add_fpp_impl_parsers
 
+# regex pattern to detect -D<CMAKE_ARGUMENT>[:<TYPE>]=<VALUE> arguments for CMake
+CMAKE_REG = re.compile(r"-D([a-zA-Z0-9_]+(?::[A-Z]+)?)=(.*)")
+
 
 def utility_entry(args):
     """Entrypoint for fprime-util, main interface to F' utility"""
@@ -241,21 +244,21 @@ def validate(parsed, unknown):
     :param unknown: unknown arguments
     :return: cmake arguments to pass to CMake
     """
-    # regex pattern to detect -D<CMAKE_ARGUMENT>[:<TYPE>]=<VALUE> arguments for CMake
-    CMAKE_REG = re.compile(r"-D([a-zA-Z0-9_]+(?::[A-Z]+)?)=(.*)")
     cmake_args = {}
     make_args = {}
     # Check platforms for existing toolchain, unless the default is specified.
     if not hasattr(parsed, "command") or parsed.command is None:
         raise ArgValidationException("'fprime-util' not supplied sub-command argument")
     if parsed.command == "generate":
-        d_args = {
-            match.group(1): match.group(2)
-            for match in [CMAKE_REG.match(arg) for arg in unknown]
-            if match is not None
-        }
-        cmake_args.update(d_args)
-        unknown = [arg for arg in unknown if not CMAKE_REG.match(arg)]
+        # Split the unknown arguments into CMake definitions and the remainder with one match per argument
+        remaining = []
+        for arg in unknown:
+            match = CMAKE_REG.match(arg)
+            if match is None:
+                remaining.append(arg)
+            else:
+                cmake_args[match.group(1)] = match.group(2)
+        unknown = remaining
     # Build type only for generate, jobs only for non-generate
     elif parsed.command in [target.mnemonic for target in Target.get_all_targets()]:
         parsed.settings = None  # Force to load from cache if possible
@@ -27,19 +27,36 @@ PROTECTED_POST_PATTERN = f"protected:[\s]*{MARKER}"
 STATIC_PRE_PATTERN = f"static:{MARKER}"
 STATIC_POST_PATTERN = f"static:[\s]*{MARKER}"
 
+# All access specifier macros are handled in a single pass over the file content. Each pattern captures the specifier
+# such that its replacement is looked up rather than running one substitution pass per specifier.
+PRE_REGEX = re.compile(r"(PROTECTED|PRIVATE|STATIC)[\s]*:")
+PRE_REPLACEMENTS = {
+    "PROTECTED": PROTECTED_PRE_PATTERN,
+    "PRIVATE": PRIVATE_PRE_PATTERN,
+    "STATIC": STATIC_PRE_PATTERN,
+}
+POST_REGEX = re.compile(rf"(protected|private|static):[\s]*{MARKER}")
+POST_REPLACEMENTS = {
+    "protected": "PROTECTED:",
+    "private": "PRIVATE:",
+    "static": "STATIC:",
+}
+
 # clang-format will try to format everything it is given - restrict for the time being
-ALLOWED_EXTENSIONS = [
-    ".cpp",
-    ".c++",
-    ".cxx",
-    ".cc",
-    ".c",
-    ".hpp",
-    ".h++",
-    ".hxx",
-    ".hh",
-    ".h",
-]
+ALLOWED_EXTENSIONS = frozenset(
+    (
+        ".cpp",
+        ".c++",
+        ".cxx",
+        ".cc",
+        ".c",
+        ".hpp",
+        ".h++",
+        ".hxx",
+        ".hh",
+        ".h",
+    )
+)
 
 
 class ClangFormatter(ExecutableAction):
@@ -53,15 +70,17 @@ class ClangFormatter(ExecutableAction):
         self.verbose = options.get("verbose", False)
         self.quiet = options.get("quiet", False)
         self.validate_extensions = options.get("validate_extensions", True)
-        self.allowed_extensions = ALLOWED_EXTENSIONS.copy()
+        self.allowed_extensions = set(ALLOWED_EXTENSIONS)
         self._files_to_format: List[Path] = []
+        # Files that had markers inserted by preprocessing, the only ones postprocessing needs to read back
+        self._marked_files: List[Path] = []
 
     def is_supported(self, _=None, __=None) -> bool:
         return bool(shutil.which(self.executable))
 
     def allow_extension(self, file_ext: str) -> None:
-        """Add a file extension str to the list of allowed extension"""
-        self.allowed_extensions.append(file_ext)
+        """Add a file extension str to the set of allowed extensions"""
+        self.allowed_extensions.add(file_ext)
 
     def stage_file(self, filepath: Path) -> None:
         """Request ClangFormatter to consider the file for formatting.
@@ -90,28 +109,35 @@ class ClangFormatter(ExecutableAction):
         This is because of the access specifier macros (e.g. PROTECTED)
         that are defined in F', which clang-format does not recognize
         """
+        self._marked_files = []
         for filepath in self._files_to_format:
             # It is unsafe to write to file while reading from it
             # Better to read in memory, close the file, then re-open to write out from memory
             with open(filepath, "r") as file:
                 content = file.read()
             # Replace the strings in the file content
-            content = re.sub("PROTECTED[\s]*:", PROTECTED_PRE_PATTERN, content)
-            content = re.sub("PRIVATE[\s]*:", PRIVATE_PRE_PATTERN, content)
-            content = re.sub("STATIC[\s]*:", STATIC_PRE_PATTERN, content)
+            content, count = PRE_REGEX.subn(
+                lambda match: PRE_REPLACEMENTS[match.group(1)], content
+            )
+            # Files without any macros are left untouched rather than rewritten unchanged
+            if not count:
+                continue
             # Write the file out to the same location, seemingly in-place
             with open(filepath, "w") as file:
                 file.write(content)
+            self._marked_files.append(filepath)
 
     def _postprocess_files(self) -> None:
-        """Postprocess a file to restore the access specifier macros."""
-        for filepath in self._files_to_format:
+        """Postprocess the files marked by preprocessing to restore the access specifier macros."""
+        for filepath in self._marked_files:
             # Same logic as _preprocess_files()
             with open(filepath, "r") as file:
                 content = file.read()
-            content = re.sub(PROTECTED_POST_PATTERN, "PROTECTED:", content)
-            content = re.sub(PRIVATE_POST_PATTERN, "PRIVATE:", content)
-            content = re.sub(STATIC_POST_PATTERN, "STATIC:", content)
+            content, count = POST_REGEX.subn(
+                lambda match: POST_REPLACEMENTS[match.group(1)], content
+            )
+            if not count:
+                continue
             with open(filepath, "w") as file:
                 file.write(content)
 
@@ -150,12 +176,15 @@ class ClangFormatter(ExecutableAction):
             *self._files_to_format,
         ]
         if self.verbose:
-            print("[INFO] Clang format executable:")
-            print(f"[INFO]    {self.executable}")
-            print("[INFO] Clang format arguments:")
-            print(f"[INFO]    {clang_args[1:]}")
-            print("[INFO] Clang format style file:")
-            print(f"[INFO]    {self.style_file}")
+            # Emitted as a single write such that the block is not interleaved with other output
+            print(
+                "[INFO] Clang format executable:\n"
+                f"[INFO]    {self.executable}\n"
+                "[INFO] Clang format arguments:\n"
+                f"[INFO]    {clang_args[1:]}\n"
+                "[INFO] Clang format style file:\n"
+                f"[INFO]    {self.style_file}"
+            )
         status = subprocess.run(clang_args)
         self._postprocess_files()
         return status.returncode
@@ -13,6 +13,7 @@ Current commands include:
 
 import argparse
 import sys
+from importlib.metadata import PackageNotFoundError, version as installed_version
 from pathlib import Path
 from typing import Dict, List
 
@@ -114,8 +115,8 @@ def run_hash_to_file(
         )
         raise InvalidBuildCacheException(msg)
     print("[INFO] File(s) associated with hash 0x{:x}".format(parsed.hash))
-    for line in lines:
-        print("   ", line, end="")
+    # Single write for all matching lines
+    print("".join(f"    {line}" for line in lines), end="")
 
 
 def run_new(
@@ -217,30 +218,23 @@ def run_version_check(
     except ImportError:  # Python >=3.6
         print("[WARNING] Cannot import 'subprocess'.")
 
+    # Versions are read from installed package metadata rather than importing pip and pkg_resources
     try:
-        import pip
-
-        print(f"Pip version: {pip.__version__}")
-    except ModuleNotFoundError:  # Python >=3.6
-        print("[WARNING] Cannot import 'Pip'.")
-
-    try:
-        import pkg_resources
-    except ModuleNotFoundError:  # Python >=3.6
-        print("[WARNING] Cannot import 'pkg_resources'. Will not check tool versions.")
-        return
+        print(f"Pip version: {installed_version('pip')}")
+    except PackageNotFoundError:
+        print("[WARNING] Cannot find 'Pip'.")
 
     print("Pip packages:")
     # Used to print fprime-fpp-* versions together if they are all the same to de-clutter the output
     fpp_packages = {}
     for tool in FPRIME_PIP_PACKAGES:
         try:
-            version = pkg_resources.get_distribution(tool).version
+            version = installed_version(tool)
             if tool.startswith("fprime-fpp-"):
                 fpp_packages[tool] = version
             else:
                 print(f"    {tool}=={version}")
-        except (OSError, VersionException, pkg_resources.DistributionNotFound) as exc:
+        except (OSError, VersionException, PackageNotFoundError) as exc:
             print(f"[WARNING] {exc}")
     if fpp_packages:
         if len(set(fpp_packages.values())) == 1:
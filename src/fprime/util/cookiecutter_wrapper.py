@@ -1,19 +1,20 @@
 """ Cookie cutter wrapper used to template out components
 """
 
-import glob
 import os
-import shutil
+import re
 import sys
 
 from typing import TYPE_CHECKING
 from contextlib import contextmanager
 from pathlib import Path
 
+# cookiecutter.main pulls in jinja2 and requests, so it is imported by the new_* commands that use it rather than
+# slowing the startup of every fprime-util command
 from cookiecutter.exceptions import OutputDirExistsException
-from cookiecutter.main import cookiecutter
 
-from fprime.common.utils import confirm
+# is_valid_name remains importable from here for user templates whose hooks import it from this module
+from fprime.common.utils import confirm, is_valid_name
 from fprime.fbuild.builder import Build
 from fprime.fbuild.cmake import CMakeExecutionException
 from fprime.fpp.impl import fpp_generate_implementation
@@ -21,6 +22,9 @@ from fprime.fpp.impl import fpp_generate_implementation
 if TYPE_CHECKING:
     import argparse
 
+# Directory of the cookiecutter templates shipped with fprime-tools, built once at import
+BUILTIN_TEMPLATES_DIR = Path(__file__).parent.parent / "cookiecutter_templates"
+
 
 def run_impl(build: Build, source_path: Path):
     """Run implementation of files in source_path"""
@@ -31,11 +35,12 @@ def run_impl(build: Build, source_path: Path):
     with suppress_stdout():
         fpp_generate_implementation(build, source_path, source_path, True, False)
 
-    # Path(source_path).
-    file_list = glob.glob(f"{source_path}/*.template.*pp", recursive=False)
-    for filename in file_list:
-        new_filename = filename.replace(".template", "")
-        os.rename(filename, new_filename)
+    # Single scan of the directory, renaming by file name only such that ".template" elsewhere in the path is kept.
+    # Replace atomically overwrites an existing implementation file on every platform, where rename fails on Windows.
+    for template_file in Path(source_path).glob("*.template.*pp"):
+        template_file.replace(
+            template_file.with_name(template_file.name.replace(".template", "", 1))
+        )
 
     return True
 
@@ -88,6 +93,8 @@ def find_nearest_cmake_file(component_dir: Path, cmake_root: Path, proj_root: Pa
 
 def new_component(build: Build, parsed_args: "argparse.Namespace"):
     """Uses cookiecutter for making new components"""
+    from cookiecutter.main import cookiecutter
+
     try:
         proj_root = build.get_settings("project_root", None)
 
@@ -99,10 +106,7 @@ def new_component(build: Build, parsed_args: "argparse.Namespace"):
             source = build.get_settings("component_cookiecutter", None)
             print(f"[INFO] Cookiecutter source: {source}")
         else:
-            source = (
-                os.path.dirname(__file__)
-                + "/../cookiecutter_templates/cookiecutter-fprime-component"
-            )
+            source = str(BUILTIN_TEMPLATES_DIR / "cookiecutter-fprime-component")
             print("[INFO] Cookiecutter source: using builtin")
 
         # Use current working directory name as default namespace, unless at project root
@@ -149,6 +153,8 @@ def new_component(build: Build, parsed_args: "argparse.Namespace"):
 
 def new_deployment(build: Build, parsed_args: "argparse.Namespace"):
     """Creates a new deployment using cookiecutter"""
+    from cookiecutter.main import cookiecutter
+
     # Checks if deployment_cookiecutter is set in settings.ini file, else uses local install template as default
     if (
         build.get_settings("deployment_cookiecutter", None) is not None
@@ -157,10 +163,7 @@ def new_deployment(build: Build, parsed_args: "argparse.Namespace"):
         source = build.get_settings("deployment_cookiecutter", None)
         print(f"[INFO] Cookiecutter source: {source}")
     else:
-        source = (
-            os.path.dirname(__file__)
-            + "/../cookiecutter_templates/cookiecutter-fprime-deployment"
-        )
+        source = str(BUILTIN_TEMPLATES_DIR / "cookiecutter-fprime-deployment")
         print("[INFO] Cookiecutter: using builtin template for new deployment")
     try:
         gen_path = Path(
@@ -191,6 +194,8 @@ def new_deployment(build: Build, parsed_args: "argparse.Namespace"):
 
 def new_subtopology(build: Build, parsed_args: "argparse.Namespace"):
     """Creates a new subtopology using cookiecutter"""
+    from cookiecutter.main import cookiecutter
+
     # Checks if subtopology_cookiecutter is set in settings.ini file, else uses local install template as default
     if (
         build.get_settings("subtopology_cookiecutter", None) is not None
@@ -199,10 +204,7 @@ def new_subtopology(build: Build, parsed_args: "argparse.Namespace"):
         source = build.get_settings("subtopology_cookiecutter", None)
         print(f"[INFO] Cookiecutter source: {source}")
     else:
-        source = (
-            os.path.dirname(__file__)
-            + "/../cookiecutter_templates/cookiecutter-fprime-subtopology"
-        )
+        source = str(BUILTIN_TEMPLATES_DIR / "cookiecutter-fprime-subtopology")
         print("[INFO] Cookiecutter: using builtin template for new subtopology")
     try:
         gen_path = Path(
@@ -233,11 +235,9 @@ def new_subtopology(build: Build, parsed_args: "argparse.Namespace"):
 
 def new_module(build: Build, parsed_args: "argparse.Namespace"):
     """Creates a new F' project"""
+    from cookiecutter.main import cookiecutter
 
-    source = (
-        os.path.dirname(__file__)
-        + "/../cookiecutter_templates/cookiecutter-fprime-module"
-    )
+    source = str(BUILTIN_TEMPLATES_DIR / "cookiecutter-fprime-module")
     try:
         gen_path = Path(
             cookiecutter(
@@ -288,54 +288,23 @@ def add_to_cmake(list_file: Path, comp_path: Path, project_root: Path = None):
         else project_root.name / list_file.relative_to(project_root)
     )
     print(f"[INFO] Found CMake file at '{short_display_path}'")
-    with open(list_file, "r") as f:
-        lines = f.readlines()
+    contents = list_file.read_text()
 
     addition = (
         'add_fprime_subdirectory("${CMAKE_CURRENT_LIST_DIR}/' + str(comp_path) + '/")\n'
     )
-    if addition in lines:
+    # Search for the addition as a whole line in one pass over the text
+    if re.search(f"^{re.escape(addition)}", contents, re.MULTILINE):
         print("Already added to CMakeLists.txt")
         return True
 
     if not confirm(f"Add {comp_path} to {short_display_path} at end of file?"):
         return False
 
-    lines.append(addition)
-    with open(list_file, "w") as f:
-        f.write("".join(lines))
+    # Append rather than rewrite the whole file, ensuring the addition starts on its own line
+    with open(list_file, "a") as file_handle:
+        if contents and not contents.endswith("\n"):
+            file_handle.write("\n")
+        file_handle.write(addition)
     return True
 
-
-def is_valid_name(word: str):
-    invalid_characters = [
-        "#",
-        "%",
-        "&",
-        "{",
-        "}",
-        "/",
-        "\\",
-        "<",
-        ">",
-        "*",
-        "?",
-        " ",
-        "$",
-        "!",
-        "'",
-        '"',
-        ":",
-        "@",
-        "+",
-        "`",
-        "|",
-        "=",
-        "-",
-    ]
-    for char in invalid_characters:
-        if isinstance(word, str) and char in word:
-            return char
-        if not isinstance(word, str):
-            raise ValueError("Incorrect usage of is_valid_name")
-    return "valid"
@@ -18,13 +18,12 @@ long paragraph description
 
 import os
 import sys
+from importlib.metadata import PackageNotFoundError, version
 
-# Attempt to get pkg_resources from "setuptools"
+# Read the installed version from package metadata, avoiding the slow import of pkg_resources at startup
 try:
-    import pkg_resources
-
-    VERSION = pkg_resources.get_distribution("fprime-tools").version
-except ImportError:
+    VERSION = version("fprime-tools")
+except PackageNotFoundError:
     VERSION = "(unknown version)"
 
 
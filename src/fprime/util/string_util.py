@@ -4,14 +4,45 @@ Utility functions to process strings to be used in FPrime GDS
 @Created March 18, 2021
 @`janamian`
 
-Note: This function has an identical copy in fprime-gds
+Note: This function has a copy in fprime-gds. The copy here caches converted templates, so the two are no longer
+identical; keep their behavior in sync.
 """
 
 import logging
 import re
+from functools import lru_cache
 
 LOGGER = logging.getLogger("string_util_logger")
 
+# C-string conversion specifier, see format_string_template for the breakdown of each group
+FORMAT_REGEX = re.compile(
+    r"(?<!%)(?:%%)*%([\-\+0\ \#])?(\d+|\*)?(\.\*|\.\d+)?([hLIw]|l{1,2}|I32|I64)?([cCdiouxXeEfgGaAnpsSZ])"
+)
+# Conversion types kept in the python template, all others are duck-typed
+KEPT_CONVERSIONS = frozenset("fFxXoOeE")
+INT_CONVERSIONS = frozenset("dD")
+
+
+def _convert_specifier(match_obj, ignore_int):
+    """Convert a single C-string conversion specifier match into a python format field"""
+    flags, width, precision, length, conversion_type = match_obj.groups()
+    format_template = f"{flags or ''}{width or ''}{precision or ''}"
+
+    if conversion_type in KEPT_CONVERSIONS or (
+        not ignore_int and conversion_type in INT_CONVERSIONS
+    ):
+        format_template += conversion_type
+
+    return "{:" + format_template + "}" if format_template else "{}"
+
+
+@lru_cache(maxsize=256)
+def _convert_template(format_str, ignore_int):
+    """Convert a C-string template into a python format template. Templates repeat per channel/event, so are cached"""
+    return FORMAT_REGEX.sub(
+        lambda match_obj: _convert_specifier(match_obj, ignore_int), format_str
+    )
+
 
 def format_string_template(format_str, given_values):
     """
@@ -41,39 +72,6 @@ def format_string_template(format_str, given_values):
     `Regex Source: https://www.regexlib.com/REDetails.aspx?regexp_id=3363`
     """
 
-    def convert(match_obj, ignore_int):
-        if match_obj.group() is None:
-            return match_obj
-        flags, width, precision, length, conversion_type = match_obj.groups()
-        format_template = ""
-        if flags:
-            format_template += f"{flags}"
-        if width:
-            format_template += f"{width}"
-        if precision:
-            format_template += f"{precision}"
-
-        if conversion_type:
-            if any(
-                [
-                    str(conversion_type).lower() == "f",
-                    str(conversion_type).lower() == "x",
-                    str(conversion_type).lower() == "o",
-                    str(conversion_type).lower() == "e",
-                ]
-            ):
-                format_template += f"{conversion_type}"
-            elif all([not ignore_int, str(conversion_type).lower() == "d"]):
-                format_template += f"{conversion_type}"
-
-        return "{:" + format_template + "}" if format_template else "{}"
-
-    def convert_include_all(match_obj):
-        return convert(match_obj, ignore_int=False)
-
-    def convert_ignore_int(match_obj):
-        return convert(match_obj, ignore_int=True)
-
     # Allowing single, list and tuple inputs
     if not isinstance(given_values, (list, tuple)):
         values = (given_values,)
@@ -82,13 +80,9 @@ def format_string_template(format_str, given_values):
     else:
         values = given_values
 
-    pattern = "(?<!%)(?:%%)*%([\-\+0\ \#])?(\d+|\*)?(\.\*|\.\d+)?([hLIw]|l{1,2}|I32|I64)?([cCdiouxXeEfgGaAnpsSZ])"
-
-    match = re.compile(pattern)
-
     # First try to include all types
     try:
-        formatted_str = re.sub(match, convert_include_all, format_str)
+        formatted_str = _convert_template(format_str, False)
         result = formatted_str.format(*values)
         result = result.replace("%%", "%")
         return result
@@ -103,7 +97,7 @@ def format_string_template(format_str, given_values):
     # This will resolve failing ENUMs with %d
     # but will fail on other types.
     try:
-        formatted_str = re.sub(match, convert_ignore_int, format_str)
+        formatted_str = _convert_template(format_str, True)
         result = formatted_str.format(*values)
         result = result.replace("%%", "%")
         return result
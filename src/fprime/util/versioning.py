@@ -3,6 +3,7 @@
 import argparse
 import sys
 from pathlib import Path
+from typing import Sequence, Tuple
 
 
 class VersionException(Exception):
@@ -26,7 +27,19 @@ FPRIME_PIP_PACKAGES = [
 ]
 
 
-def get_version(package: str, requirements: Path):
+def read_requirements(requirements: Path) -> Tuple[str, ...]:
+    """Read the stripped lines of a requirements file
+
+    Callers checking several packages against the same file read it once and pass the lines to get_version.
+
+    Args:
+        requirements: path to requirements file to read
+    """
+    with open(requirements, "r") as file_handle:
+        return tuple(line.strip() for line in file_handle)
+
+
+def get_version(package: str, requirements: Path, lines: Sequence[str] = None):
     """Get the version as specified in the requirements file
 
     This will read all requirements from the requirements file and attempt to print the version of the package that is
@@ -36,11 +49,11 @@ def get_version(package: str, requirements: Path):
     Args:
         package: name of package to look for
         requirements: path to requirements file to parse
+        lines: already read lines of the requirements file. Read from requirements when not supplied.
     """
-    with open(requirements, "r") as file_handle:
-        matching_lines = [
-            line.strip() for line in file_handle.readlines() if package in line
-        ]
+    if lines is None:
+        lines = read_requirements(requirements)
+    matching_lines = [line for line in lines if package in line]
     if not matching_lines:
         msg = f"Could not find {package} in requirements file"
         raise VersionException(msg)
@@ -50,7 +63,9 @@ def get_version(package: str, requirements: Path):
         raise VersionException(msg)
 
     # Collapse versions that match
-    versions = list({line.split("==")[-1].split("@")[-1] for line in valid_lines})
+    versions = list(
+        {line.rpartition("==")[2].rpartition("@")[2] for line in valid_lines}
+    )
     if len(versions) != 1:
         msg = f"Conflicting versions specified for {package}: {versions}"
         raise VersionException(msg)
@@ -34,8 +34,10 @@ from fprime.common.models.serialize.type_exceptions import (
     DeserializeException,
     EnumMismatchException,
     IncorrectMembersException,
+    InvalidRepresentationTypeException,
     MissingMemberException,
     NotInitializedException,
+    RepresentationTypeRangeException,
     StringSizeException,
     TypeMismatchException,
     TypeRangeException,
@@ -94,6 +96,10 @@ def valid_values_test(type_input, valid_values, sizes):
 
         # Check serialization and deserialization
         serialized = instantiation.serialize()
+        for offset in [0, 10, 50]:
+            buffer = bytearray(offset + len(serialized))
+            assert instantiation.serialize_into(buffer, offset) == len(serialized)
+            assert bytes(buffer[offset:]) == serialized, "Serialize into has failed"
         for offset in [0, 10, 50]:
             deserializer = type_input()
             deserializer.deserialize((b" " * offset) + serialized, offset)
@@ -105,6 +111,14 @@ def valid_values_test(type_input, valid_values, sizes):
             assert (
                 serialized == new_serialized_bytes
             ), "Repeated serialization has failed"
+            # Check deserialization from a memoryview, which must be accepted without copying
+            view_deserializer = type_input()
+            view_deserializer.deserialize(
+                memoryview((b" " * offset) + serialized), offset
+            )
+            assert (
+                instantiation.val == view_deserializer.val
+            ), "Deserialization from memoryview has failed"
     return instantiation
 
 
@@ -268,6 +282,26 @@ def test_enum_off_nominal():
         enum_class,
         filter(lambda item: not isinstance(item, str), PYTHON_TESTABLE_TYPES),
     )
+    # Representation type must be an F prime integer type
+    with pytest.raises(InvalidRepresentationTypeException) as excinfo:
+        EnumType.construct_type("SomeBadRepEnum", members, "F32")
+    assert "Representation type F32 not found" in excinfo.value.getMsg()
+    with pytest.raises(RepresentationTypeRangeException) as excinfo:
+        EnumType.construct_type("SomeOutOfRangeEnum", {"MEMB1": 300}, "U8")
+    assert "out of range of representation type U8 (0-255)" in excinfo.value.getMsg()
+
+
+def test_enum_deserialize_values():
+    """
+    Tests the EnumType deserialization of aliased and undefined values
+    """
+    members = {"MEMB1": 0, "MEMB2": 6, "ALIAS2": 6}
+    enum_class = EnumType.construct_type("SomeAliasedEnum", members)
+    instance = enum_class()
+    instance.deserialize(I32Type(6).serialize(), 0)
+    assert instance.val == "MEMB2"
+    with pytest.raises(TypeRangeException):
+        instance.deserialize(I32Type(9).serialize(), 0)
 
 
 def test_string_nominal():
@@ -279,6 +313,17 @@ def test_string_nominal():
     )
     # String type defined a max-size of 10 plus 2 for the size data
     assert instance.__class__.getMaxSize() == 10 + 2
+    # An uninitialized string has no size
+    with pytest.raises(NotInitializedException):
+        string_type().getSize()
+
+
+def test_string_multibyte():
+    """Tests that string sizes count encoded bytes rather than characters"""
+    string_type = StringType.construct_type("MyMultibyteString", max_length=10)
+    valid_values_test(string_type, ["é", "aéb", "ééééé"], [2 + 2, 2 + 4, 2 + 10])
+    # Six characters fit within the maximum length, but their twelve encoded bytes do not
+    invalid_values_test(string_type, ["éééééé"], StringSizeException)
 
 
 def test_string_off_nominal():
@@ -290,6 +335,12 @@ def test_string_off_nominal():
         string_type,
         filter(lambda item: not isinstance(item, str), PYTHON_TESTABLE_TYPES),
     )
+    # A failed decode leaves the previous value and its serialized form intact
+    instance = string_type("ab")
+    with pytest.raises(UnicodeDecodeError):
+        instance.deserialize(b"\x00\x02\xff\xfe", 0)
+    assert instance.val == "ab"
+    assert instance.serialize() == b"\x00\x02ab"
 
 
 def test_serializable_basic():
@@ -354,7 +405,58 @@ def test_serializable_basic_off_nominal():
     )
 
 
-def test_serializable_advanced():
+def test_serializable_fixed_layout():
+    """Serializable type built only from fixed-size members, including nested arrays and serializables"""
+    sub_serializable_class = SerializableType.construct_type(
+        "FixedSubSerializable",
+        [("subfield1", BoolType), ("subfield2", I16Type)],
+    )
+    serializable_class = SerializableType.construct_type(
+        "FixedSerializable",
+        [
+            ("field1", U8Type),
+            ("field2", ArrayType.construct_type("FixedArrayMember", U16Type, 2, "%d")),
+            ("field3", sub_serializable_class),
+            ("field4", EnumType.construct_type("FixedEnumMember", {"A": 1}, "U8")),
+        ],
+    )
+    value = {
+        "field1": 7,
+        "field2": [1, 2],
+        "field3": {"subfield1": True, "subfield2": -3},
+        "field4": "A",
+    }
+    instance = valid_values_test(serializable_class, [value], [1 + 4 + 3 + 1])
+    assert instance.__class__.getMaxSize() == 1 + 4 + 3 + 1
+    # Scalar members are unpacked together, yet still range checked
+    with pytest.raises(TypeRangeException):
+        sub_serializable_class().deserialize(b"\x01\x00\x00", 0)
+    # Members without a format string are formatted as plain strings
+    assert instance.formatted_val == {
+        "field1": "7",
+        "field2": ["1", "2"],
+        "field3": {"subfield1": "True", "subfield2": "-3"},
+        "field4": "A",
+    }
+
+
+def test_serializable_time_member():
+    """Serializable type with a TimeType member, which has no validate of its own"""
+    serializable_class = SerializableType.construct_type(
+        "WithTime", [("a", U8Type, "%d"), ("t", TimeType, "%s")]
+    )
+    time_value = TimeType(TimeBase["TB_WORKSTATION_TIME"].value, 0, 1, 2)
+    serialized = U8Type(3).serialize() + time_value.serialize()
+    assert len(serialized) == 12
+
+    instance = serializable_class()
+    instance.deserialize(serialized, 0)
+    assert instance.getSize() == 12
+    assert instance.serialize() == serialized
+    jsonable = instance.to_jsonable()
+    assert jsonable["a"]["value"] == 3
+    assert (jsonable["t"]["seconds"], jsonable["t"]["microseconds"]) == (1, 2)
+
     """
     Tests the SerializableType serialization and deserialization
     """
@@ -413,10 +515,23 @@ def test_array_type():
             3,
             "%s",
         ),
+        ("TestArray4", BoolType, 3, "%s"),
+        (
+            "TestArray5",
+            EnumType.construct_type("TestArrayEnum", {"ONE": 1, "TWO": 2}, "U8"),
+            2,
+            "%s",
+        ),
+    ]
+    values = [
+        [32, 1],
+        [0, 1, 2, 3],
+        ["one", "1234", "1"],
+        [True, False, True],
+        ["TWO", "ONE"],
     ]
-    values = [[32, 1], [0, 1, 2, 3], ["one", "1234", "1"]]
-    sizes = [8, 4, 14]
-    max_sizes = [8, 4, (2 + 18) * 3]
+    sizes = [8, 4, 14, 3, 2]
+    max_sizes = [8, 4, (2 + 18) * 3, 3, 2]
     for ctor_args, values, size, max_size in zip(
         extra_ctor_args, values, sizes, max_sizes
     ):
@@ -441,6 +556,32 @@ def test_array_type_off_nominal():
         type_input,
         filter(lambda item: not isinstance(item, (list, tuple)), PYTHON_TESTABLE_TYPES),
     )
+    enum_type_input = ArrayType.construct_type(
+        "TestArrayPickyEnum",
+        EnumType.construct_type("TestArrayPickyEnumMember", {"ONE": 1}),
+        2,
+        "%s",
+    )
+    with pytest.raises(TypeRangeException):
+        enum_type_input().deserialize(I32Type(1).serialize() * 2 + b"\0", 1)
+
+
+def test_array_type_formatting():
+    """
+    Tests the ArrayType formatted values and JSONable output
+    """
+    type_input = ArrayType.construct_type("TestArrayHex", U8Type, 3, "%x")
+    instance = type_input([10, 11, 255])
+    assert instance.formatted_val == ["a", "b", "ff"]
+    jsonable = instance.to_jsonable()
+    assert jsonable["size"] == 3
+    assert [item["value"] for item in jsonable["values"]] == [10, 11, 255]
+    json.loads(json.dumps(jsonable))
+
+    nested_input = ArrayType.construct_type("TestArrayNested", type_input, 2, "%s")
+    nested = nested_input([[1, 2, 3], [4, 5, 16]])
+    assert nested.formatted_val == [["1", "2", "3"], ["4", "5", "10"]]
+    assert nested.to_jsonable()["name"] == "TestArrayNested"
 
 
 def test_time_type():
@@ -547,3 +688,24 @@ def test_dictionary_type_errors():
     DictionaryType.construct_type(str, "MyNewString3", PROPERTY1="one", PROPERTY2="two")
     with pytest.raises(AssertionError):
         DictionaryType.construct_type(str, "MyNewString3", PROPERTY1="one")
+
+
+def test_dictionary_type_slots():
+    """Ensure constructed dictionary types and primitive types do not allocate a per-instance __dict__"""
+    string_type = StringType.construct_type("SlottedString", max_length=10)
+    enum_type = EnumType.construct_type("SlottedEnum", {"ONE": 1})
+    array_type = ArrayType.construct_type("SlottedArray", U8Type, 2, "%d")
+    serializable_type = SerializableType.construct_type(
+        "SlottedSerializable", [("member1", U8Type, "%d")]
+    )
+    for instance in [
+        string_type("abc"),
+        enum_type("ONE"),
+        array_type([1, 2]),
+        serializable_type({"member1": 1}),
+        U32Type(1),
+        F64Type(1.0),
+        BoolType(True),
+        TimeType(),
+    ]:
+        assert not hasattr(instance, "__dict__")
@@ -0,0 +1,18 @@
+"""
+Tests the common utility functions
+"""
+
+import pytest
+
+from fprime.common.utils import is_valid_name
+
+
+def test_is_valid_name():
+    """Tests valid names and the character reported for invalid ones"""
+    assert is_valid_name("MyComponent_1") == "valid"
+    assert is_valid_name("My Component") == " "
+    assert is_valid_name("a\\b") == "\\"
+    # The reported character follows INVALID_NAME_CHARACTERS order rather than its position in the name
+    assert is_valid_name("a-b#c") == "#"
+    with pytest.raises(ValueError):
+        is_valid_name(None)